@@ -14,12 +14,14 @@ setup(
         "click>=8.1.0",
         "rich>=13.0.0",
         "beautifulsoup4>=4.12.0",
+        "lxml>=4.9.0",
         "requests>=2.31.0",
         "pandas>=2.0.0",
         "ratelimit>=2.2.1",
     ],
     extras_require={
         "reddit": ["praw>=7.7.0"],
+        "fast": ["orjson>=3.8"],
         "dev": ["pytest", "black", "flake8"],
     },
     entry_points={
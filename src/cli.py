@@ -300,7 +300,7 @@ def load_json(ctx, json_file, data_type):
     try:
         engine = get_engine(data_dir)
 
-        with open(json_file, 'r') as f:
+        with open(json_file, 'r', encoding='utf-8') as f:
             data = json.load(f)
 
         if data_type == 'items':
@@ -596,7 +596,8 @@ def display_discussions(results: list):
 @click.option('--styleforum-threads', default=30, help='StyleForum threads per forum')
 @click.option('--skip-reddit', is_flag=True, help='Skip Reddit scraping')
 @click.option('--skip-ebay', is_flag=True, help='Skip eBay gap filling')
-def scrape_production(output_dir, end_items, farfetch_items, reddit_posts, styleforum_threads, skip_reddit, skip_ebay):
+@click.option('--resume', is_flag=True, help='Resume an interrupted End Clothing crawl from its checkpoint')
+def scrape_production(output_dir, end_items, farfetch_items, reddit_posts, styleforum_threads, skip_reddit, skip_ebay, resume):
     """
     Build production dataset by scraping End, Farfetch, Reddit, StyleForum, and eBay.
 
@@ -636,7 +637,7 @@ def scrape_production(output_dir, end_items, farfetch_items, reddit_posts, style
         # Run pipeline components
         if console:
             console.print("\n[bold cyan]Phase 1: Scraping End Clothing...[/bold cyan]")
-        orchestrator.scrape_end_clothing(max_per_category=end_items)
+        orchestrator.scrape_end_clothing(max_per_category=end_items, resume=resume)
 
         if console:
             console.print("\n[bold cyan]Phase 2: Scraping Farfetch...[/bold cyan]")
@@ -800,7 +801,7 @@ def load_production(ctx, source_dir):
         # Load items
         items_file = Path(source_dir) / "items.json"
         if items_file.exists():
-            with open(items_file, 'r') as f:
+            with open(items_file, 'r', encoding='utf-8') as f:
                 items_data = json.load(f)
             items = [ClothingItem.from_dict(d) for d in items_data]
             engine.add_items(items)
@@ -812,7 +813,7 @@ def load_production(ctx, source_dir):
         # Load brands
         brands_file = Path(source_dir) / "brands.json"
         if brands_file.exists():
-            with open(brands_file, 'r') as f:
+            with open(brands_file, 'r', encoding='utf-8') as f:
                 brands_data = json.load(f)
             brands = [Brand.from_dict(d) for d in brands_data]
             engine.add_brands(brands)
@@ -824,7 +825,7 @@ def load_production(ctx, source_dir):
         # Load discussions
         discussions_file = Path(source_dir) / "discussions.json"
         if discussions_file.exists():
-            with open(discussions_file, 'r') as f:
+            with open(discussions_file, 'r', encoding='utf-8') as f:
                 discussions_data = json.load(f)
             discussions = [StyleDiscussion.from_dict(d) for d in discussions_data]
             engine.add_discussions(discussions)
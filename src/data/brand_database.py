@@ -6,6 +6,7 @@ with their typical products, aesthetics, and characteristics.
 
 This approach is more reliable than scraping sites with bot protection.
 """
+import sys
 import uuid
 from typing import List, Dict
 from ..models.clothing import ClothingItem, Brand, StyleDiscussion
@@ -1073,18 +1074,21 @@ def generate_items_from_database() -> List[ClothingItem]:
     items = []
     item_counter = 1
 
+    # Categories, fits, colors and materials come from a small shared vocabulary,
+    # so intern them to keep a single copy of each string across all items
     for brand_name, brand_data in BRAND_DATABASE.items():
         for product in brand_data.get('products', []):
+            fit = product.get('fit')
             item = ClothingItem(
                 id=f"prod_{item_counter:04d}",
                 name=product['name'],
                 brand=brand_name,
-                category=product['category'],
+                category=sys.intern(product['category']),
                 description=product['description'],
-                fit=product.get('fit'),
+                fit=sys.intern(fit) if fit else None,
                 style_tags=brand_data.get('aesthetics', []),
-                colors=product.get('colors', []),
-                materials=product.get('materials', []),
+                colors=[sys.intern(c) for c in product.get('colors', [])],
+                materials=[sys.intern(m) for m in product.get('materials', [])],
                 source_url=None,
                 source_type="brand_database",
                 price_usd=product.get('price'),
@@ -55,6 +55,36 @@ def _deserialize_metadata(metadata: dict) -> dict:
     return deserialized
 
 
+def _format_results(results: dict) -> list[dict[str, Any]]:
+    """
+    Convert a ChromaDB query response into a list of result dicts.
+
+    Only the first query's results are used, since every search issues
+    a single query embedding.
+    """
+    ids = results['ids'][0]
+    if not ids:
+        return []
+
+    metadatas = results['metadatas'][0]
+    distances = results['distances'][0]
+    documents = results['documents'][0]
+
+    # Convert cosine distance to similarity score
+    # Cosine distance in ChromaDB: distance = 1 - cosine_similarity
+    # Raw cosine similarity rarely exceeds 0.7 even for very similar text, so
+    # a power of 0.5 (square root) stretches scores: 0.56 -> 0.75, 0.35 -> 0.59
+    return [
+        {
+            'id': item_id,
+            'metadata': _deserialize_metadata(metadata),
+            'similarity': round(max(0, 1 - distance) ** 0.5, 3),
+            'matched_text': document,
+        }
+        for item_id, metadata, distance, document in zip(ids, metadatas, distances, documents)
+    ]
+
+
 class StyleSearchEngine:
     """
     Semantic search engine for finding clothing items based on style descriptions.
@@ -106,6 +136,14 @@ class StyleSearchEngine:
         # Create persist directory if it doesn't exist
         os.makedirs(persist_directory, exist_ok=True)
 
+        # Document embeddings are cached on disk per model, so re-indexing the
+        # same texts (e.g. after 'clear') skips the transformer entirely
+        model_slug = model_name.replace('/', '_')
+        self.embedding_cache_path = os.path.join(
+            persist_directory, f"embedding_cache_{model_slug}.npz"
+        )
+        self._embedding_cache: Optional[dict] = None
+
         # Initialize ChromaDB with persistence
         logger.info(f"Initializing vector database at: {persist_directory}")
         self.client = chromadb.PersistentClient(path=persist_directory)
@@ -129,6 +167,70 @@ class StyleSearchEngine:
 
         logger.info("Search engine initialized successfully")
 
+    def _embed_documents(self, documents: list[str]) -> list[list[float]]:
+        """
+        Embed documents for indexing.
+
+        Embeddings are L2-normalized so that ChromaDB's cosine distance
+        works on unit vectors, matching how the MiniLM models are trained.
+        Only documents missing from the on-disk embedding cache are encoded.
+        """
+        import hashlib
+
+        cache = self._load_embedding_cache()
+        keys = [hashlib.sha1(doc.encode('utf-8')).hexdigest() for doc in documents]
+
+        missing = {}
+        for key, doc in zip(keys, documents):
+            if key not in cache:
+                missing[key] = doc
+
+        if missing:
+            logger.info(f"Encoding {len(missing)} new documents ({len(documents) - len(missing)} cached)")
+            vectors = self.model.encode(list(missing.values()), normalize_embeddings=True)
+            cache.update(zip(missing.keys(), vectors))
+            self._save_embedding_cache()
+
+        return [cache[key].tolist() for key in keys]
+
+    def _load_embedding_cache(self) -> dict:
+        """Load the document embedding cache from disk on first use."""
+        if self._embedding_cache is None:
+            import numpy as np
+
+            self._embedding_cache = {}
+            if os.path.exists(self.embedding_cache_path):
+                try:
+                    with np.load(self.embedding_cache_path) as data:
+                        self._embedding_cache = dict(zip(data['keys'].tolist(), data['vectors']))
+                except (OSError, KeyError, ValueError) as e:
+                    logger.warning(f"Ignoring unreadable embedding cache: {e}")
+
+        return self._embedding_cache
+
+    def _save_embedding_cache(self):
+        """Write the document embedding cache to disk."""
+        import numpy as np
+
+        cache = self._embedding_cache
+        tmp_path = self.embedding_cache_path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            np.savez(
+                f,
+                keys=np.array(list(cache.keys())),
+                vectors=np.stack(list(cache.values())),
+            )
+        os.replace(tmp_path, self.embedding_cache_path)
+
+    def _embed_query(self, query: str) -> list[list[float]]:
+        """
+        Embed a single search query the same way documents are embedded.
+
+        Returns the value to pass as query_embeddings - a list holding one
+        vector, since chromadb 0.4 does not accept numpy arrays there.
+        """
+        return [self.model.encode(query, normalize_embeddings=True).tolist()]
+
     def add_items(self, items: list[ClothingItem]):
         """
         Add clothing items to the search index.
@@ -148,7 +250,7 @@ class StyleSearchEngine:
         metadatas = [_serialize_metadata(item.to_dict()) for item in items]
 
         # Generate embeddings
-        embeddings = self.model.encode(documents).tolist()
+        embeddings = self._embed_documents(documents)
 
         # Add to collection
         self.items_collection.add(
@@ -176,7 +278,7 @@ class StyleSearchEngine:
         documents = [brand.to_searchable_text() for brand in brands]
         metadatas = [_serialize_metadata(brand.to_dict()) for brand in brands]
 
-        embeddings = self.model.encode(documents).tolist()
+        embeddings = self._embed_documents(documents)
 
         self.brands_collection.add(
             ids=ids,
@@ -203,7 +305,7 @@ class StyleSearchEngine:
         documents = [disc.to_searchable_text() for disc in discussions]
         metadatas = [_serialize_metadata(disc.to_dict()) for disc in discussions]
 
-        embeddings = self.model.encode(documents).tolist()
+        embeddings = self._embed_documents(documents)
 
         self.discussions_collection.add(
             ids=ids,
@@ -235,39 +337,17 @@ class StyleSearchEngine:
         logger.info(f"Searching items for: {query}")
 
         # Generate query embedding
-        query_embedding = self.model.encode([query]).tolist()[0]
+        query_embeddings = self._embed_query(query)
 
         # Search in ChromaDB
         results = self.items_collection.query(
-            query_embeddings=[query_embedding],
+            query_embeddings=query_embeddings,
             n_results=n_results,
             where=filters,
             include=["documents", "metadatas", "distances"]
         )
 
-        # Format results
-        formatted_results = []
-        if results['ids'][0]:
-            for i in range(len(results['ids'][0])):
-                # Convert cosine distance to similarity score
-                # Cosine distance in ChromaDB: distance = 1 - cosine_similarity
-                # So: cosine_similarity = 1 - distance
-                distance = results['distances'][0][i]
-                raw_similarity = max(0, 1 - distance)
-
-                # Apply power transformation for more intuitive scores
-                # Raw cosine similarity rarely exceeds 0.7 even for very similar text
-                # Power of 0.5 (square root) stretches scores: 0.56 -> 0.75, 0.35 -> 0.59
-                similarity = raw_similarity ** 0.5
-
-                formatted_results.append({
-                    'id': results['ids'][0][i],
-                    'metadata': _deserialize_metadata(results['metadatas'][0][i]),
-                    'similarity': round(similarity, 3),
-                    'matched_text': results['documents'][0][i],
-                })
-
-        return formatted_results
+        return _format_results(results)
 
     def search_brands(
         self,
@@ -286,29 +366,15 @@ class StyleSearchEngine:
         """
         logger.info(f"Searching brands for: {query}")
 
-        query_embedding = self.model.encode([query]).tolist()[0]
+        query_embeddings = self._embed_query(query)
 
         results = self.brands_collection.query(
-            query_embeddings=[query_embedding],
+            query_embeddings=query_embeddings,
             n_results=n_results,
             include=["documents", "metadatas", "distances"]
         )
 
-        formatted_results = []
-        if results['ids'][0]:
-            for i in range(len(results['ids'][0])):
-                distance = results['distances'][0][i]
-                raw_similarity = max(0, 1 - distance)
-                similarity = raw_similarity ** 0.5  # Power transformation
-
-                formatted_results.append({
-                    'id': results['ids'][0][i],
-                    'metadata': _deserialize_metadata(results['metadatas'][0][i]),
-                    'similarity': round(similarity, 3),
-                    'matched_text': results['documents'][0][i],
-                })
-
-        return formatted_results
+        return _format_results(results)
 
     def search_discussions(
         self,
@@ -327,29 +393,15 @@ class StyleSearchEngine:
         """
         logger.info(f"Searching discussions for: {query}")
 
-        query_embedding = self.model.encode([query]).tolist()[0]
+        query_embeddings = self._embed_query(query)
 
         results = self.discussions_collection.query(
-            query_embeddings=[query_embedding],
+            query_embeddings=query_embeddings,
             n_results=n_results,
             include=["documents", "metadatas", "distances"]
         )
 
-        formatted_results = []
-        if results['ids'][0]:
-            for i in range(len(results['ids'][0])):
-                distance = results['distances'][0][i]
-                raw_similarity = max(0, 1 - distance)
-                similarity = raw_similarity ** 0.5  # Power transformation
-
-                formatted_results.append({
-                    'id': results['ids'][0][i],
-                    'metadata': _deserialize_metadata(results['metadatas'][0][i]),
-                    'similarity': round(similarity, 3),
-                    'matched_text': results['documents'][0][i],
-                })
-
-        return formatted_results
+        return _format_results(results)
 
     def comprehensive_search(
         self,
@@ -7,7 +7,9 @@ from datetime import datetime
 import json
 
 
-@dataclass
+# Scrapers create items and brands by the thousand, so these use slots:
+# no per-instance __dict__, and faster attribute access
+@dataclass(slots=True)
 class ClothingItem:
     """Represents a single clothing item with its attributes."""
 
@@ -67,7 +69,7 @@ class ClothingItem:
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class Brand:
     """Represents a clothing brand with its aesthetic profile."""
 
@@ -184,6 +186,6 @@ def save_items_to_json(items: list, filepath: str):
 
 def load_items_from_json(filepath: str, item_class):
     """Load items from JSON file."""
-    with open(filepath, 'r') as f:
+    with open(filepath, 'r', encoding='utf-8') as f:
         data = json.load(f)
     return [item_class.from_dict(item) for item in data]
@@ -1,45 +1,228 @@
 """
 Base scraper class with common functionality.
 """
+import json
+import queue
+import threading
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 import time
 from abc import ABC, abstractmethod
-from typing import Generator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Callable, Generator, Iterable
+from urllib.parse import urlparse
 import logging
 from ratelimit import limits, sleep_and_retry
 
+# orjson is optional - it parses embedded page JSON several times faster
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
+def json_loads(data: str | bytes):
+    """
+    Parse JSON, using orjson when installed.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+    catch the same exceptions either way.
+    """
+    if ORJSON_AVAILABLE:
+        # orjson rejects str subclasses such as bs4's NavigableString
+        # (script.string), so hand it a plain str
+        if isinstance(data, str):
+            data = str(data)
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj, indent: bool = False) -> bytes:
+    """
+    Serialize to UTF-8 JSON bytes, using orjson when installed.
+
+    Args:
+        obj: JSON-serializable object (dict keys must be strings)
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        Encoded JSON
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+# Max requests per host per minute, shared by every scraper in the process
+REQUESTS_PER_MINUTE = 10
+
+_host_limiters: dict[str, Callable[[], None]] = {}
+_host_limiters_lock = threading.Lock()
+
+
+def _wait_for_host(host: str):
+    """
+    Block until another request to host fits in its rate limit.
+
+    Each host has its own budget, so concurrent crawls of different sites
+    don't slow each other down while each site still sees at most
+    REQUESTS_PER_MINUTE requests.
+    """
+    with _host_limiters_lock:
+        limiter = _host_limiters.get(host)
+        if limiter is None:
+            limiter = _host_limiters[host] = sleep_and_retry(
+                limits(calls=REQUESTS_PER_MINUTE, period=60)(lambda: None)
+            )
+    # Sleeps outside the lock so other hosts aren't held up
+    limiter()
+
+
+def class_strainer(match: Callable[[str], bool]) -> SoupStrainer:
+    """
+    Build a SoupStrainer keeping elements with a class accepted by match.
+
+    While parsing, a strainer sees the raw class attribute (e.g.
+    "s-item s-item__pl-on-bottom") rather than the list of classes find_all
+    matches against, so class_=[...] or an anchored regex drops elements
+    with more than one class. This splits the attribute and tests each class.
+
+    Args:
+        match: Predicate for a single class name
+
+    Returns:
+        Strainer to pass as fetch_page's parse_only
+    """
+    def has_class(value: str | None) -> bool:
+        return value is not None and any(match(name) for name in value.split())
+
+    return SoupStrainer(class_=has_class)
+
+
+# Marks the end of one iterable in iterate_concurrently's result queue
+_DONE = object()
+
+
+def iterate_concurrently(
+    iterables: Iterable[Iterable],
+    max_workers: int = 4,
+    buffer_size: int | None = None,
+) -> Generator:
+    """
+    Drain several iterables on worker threads, yielding items as they arrive.
+
+    Used to crawl independent sections (categories, brands) side by side so
+    one section's network waits overlap another's. Items from the same
+    iterable keep their order; items from different iterables interleave.
+    Request volume is still bounded by fetch_html's per-host rate limit.
+
+    Args:
+        iterables: Iterables to drain, typically scraper generators
+        max_workers: Number of iterables drained at once
+        buffer_size: Max items workers may get ahead of the consumer;
+            defaults to four per worker
+
+    Yields:
+        Items from all iterables
+
+    Raises:
+        Any exception raised while draining an iterable, in the consumer.
+    """
+    iterables = list(iterables)
+    if not iterables:
+        return
+
+    # Bounded so workers don't scrape far ahead of a slow consumer
+    results = queue.Queue(maxsize=buffer_size or max_workers * 4)
+    stop = threading.Event()
+
+    def put(entry) -> bool:
+        while not stop.is_set():
+            try:
+                results.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def drain(iterable):
+        try:
+            for item in iterable:
+                if not put((item, None)):
+                    return
+        except Exception as e:
+            put((_DONE, e))
+            return
+        put((_DONE, None))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for iterable in iterables:
+            executor.submit(drain, iterable)
+
+        remaining = len(iterables)
+        try:
+            while remaining:
+                item, error = results.get()
+                if item is _DONE:
+                    remaining -= 1
+                    if error is not None:
+                        raise error
+                    continue
+                yield item
+        finally:
+            # Lets workers exit after their current item if the consumer
+            # stops early or a worker failed
+            stop.set()
+
+
 class BaseScraper(ABC):
     """Base class for all scrapers."""
 
-    def __init__(self, delay_seconds: float = 1.0):
+    def __init__(self, delay_seconds: float = 1.0, max_retries: int = 0):
         """
         Initialize scraper with polite delay between requests.
 
         Args:
             delay_seconds: Minimum delay between requests to be respectful
+            max_retries: Times to retry a request on connection errors or
+                429/5xx responses, with exponential backoff
         """
         self.delay_seconds = delay_seconds
         self.session = requests.Session()
+        # Scrapers fetch from worker threads, so keep enough pooled
+        # keep-alive connections per host for all of them
+        retries = Retry(
+            total=max_retries,
+            backoff_factor=1.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ) if max_retries else 0
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retries)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.session.headers.update({
             'User-Agent': 'StyleTranslator/1.0 (Educational/Research Purpose)',
         })
 
-    @sleep_and_retry
-    @limits(calls=10, period=60)  # Max 10 requests per minute
-    def fetch_page(self, url: str) -> BeautifulSoup | None:
+    def fetch_html(self, url: str) -> bytes | None:
         """
-        Fetch a page and return BeautifulSoup object.
+        Fetch a page and return the raw response body.
+
+        Requests are rate limited per host (see _wait_for_host).
 
         Args:
             url: URL to fetch
 
         Returns:
-            BeautifulSoup object or None if failed
+            Response bytes or None if failed
         """
+        _wait_for_host(urlparse(url).netloc)
+
         try:
             logger.info(f"Fetching: {url}")
             response = self.session.get(url, timeout=10)
@@ -48,12 +231,30 @@ class BaseScraper(ABC):
             # Be polite - wait between requests
             time.sleep(self.delay_seconds)
 
-            return BeautifulSoup(response.content, 'lxml')
+            return response.content
 
         except requests.RequestException as e:
             logger.error(f"Failed to fetch {url}: {e}")
             return None
 
+    def fetch_page(self, url: str, parse_only: SoupStrainer | None = None) -> BeautifulSoup | None:
+        """
+        Fetch a page and return BeautifulSoup object.
+
+        Args:
+            url: URL to fetch
+            parse_only: Optional strainer restricting which elements are built
+                into the tree. Scrapers that only read one region of a page
+                pass this to skip constructing the rest of the DOM.
+
+        Returns:
+            BeautifulSoup object or None if failed
+        """
+        html = self.fetch_html(url)
+        if html is None:
+            return None
+        return BeautifulSoup(html, 'lxml', parse_only=parse_only)
+
     @abstractmethod
     def scrape_products(self, url: str) -> Generator:
         """
@@ -62,6 +263,24 @@ class BaseScraper(ABC):
         """
         pass
 
+    def scrape_products_batched(self, url: str, batch_size: int = 64) -> Generator[list, None, None]:
+        """
+        Scrape products from a URL, yielding them in lists.
+
+        For sinks that write in bulk (vector store adds, JSON dumps), which
+        pay their per-call overhead once per batch instead of once per item.
+
+        Args:
+            url: URL to scrape, as for scrape_products
+            batch_size: Max items per batch; the last batch may be smaller
+
+        Yields:
+            Lists of scraped items
+        """
+        products = iter(self.scrape_products(url))
+        while batch := list(islice(products, batch_size)):
+            yield batch
+
     @abstractmethod
     def scrape_brand_info(self, brand_name: str) -> dict | None:
         """
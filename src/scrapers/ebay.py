@@ -12,17 +12,95 @@ IMPORTANT:
 - Use for research/educational purposes only
 """
 import re
+import sys
 import uuid
+import functools
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from typing import Generator, Optional, List
+from urllib.parse import urlencode, unquote_plus
 from bs4 import BeautifulSoup
+import soupsieve
 import logging
 
-from .base import BaseScraper
+from .base import BaseScraper, class_strainer
+from .keywords import KeywordMatcher
 from ..models.clothing import ClothingItem, Brand
 
 logger = logging.getLogger(__name__)
 
+# Patterns used on every listing, compiled once at import
+_PRICE_RE = re.compile(r'\$(\d+(?:\.\d{2})?)')
+_NKW_RE = re.compile(r'nkw=([^&]+)')
+
+# Only the search results region is read, so the rest of the page
+# (header, filters, footer, scripts) is never built into the tree
+_RESULTS_STRAINER = class_strainer({'s-item', 'srp-results'}.__contains__)
+
+# CSS selectors compiled once instead of re-parsed for every listing
+_LISTING_SELECTOR = soupsieve.compile('.s-item, .srp-results .s-item__wrapper')
+_TITLE_SELECTOR = soupsieve.compile('.s-item__title')
+_TITLE_FALLBACK_SELECTOR = soupsieve.compile('.s-item__info a')
+_LINK_SELECTOR = soupsieve.compile('a.s-item__link[href]')
+_PRICE_SELECTOR = soupsieve.compile('.s-item__price')
+
+# Keyword vocabularies by bucket. Category and fit labels are checked in
+# priority order.
+_TITLE_VOCABULARY = {
+    'category': {
+        'jacket': ['jacket', 'coat', 'blazer', 'parka', 'bomber'],
+        'pants': ['pants', 'trousers', 'chinos', 'slacks'],
+        'jeans': ['jeans', 'denim pants', 'jean'],
+        'shirt': ['shirt', 'button up', 'oxford', 'flannel'],
+        't-shirt': ['t-shirt', 'tee', 'tshirt'],
+        'sweater': ['sweater', 'cardigan', 'knit', 'pullover'],
+        'hoodie': ['hoodie', 'hooded', 'sweatshirt'],
+        'shorts': ['shorts'],
+        'shoes': ['shoes', 'boots', 'sneakers', 'loafers'],
+    },
+    'fit': {fit: [fit] for fit in ['slim', 'relaxed', 'oversized', 'tapered']},
+    'colors': {
+        color: [color]
+        for color in ['black', 'navy', 'blue', 'grey', 'olive', 'khaki', 'white', 'brown', 'indigo']
+    },
+    'materials': {mat: [mat] for mat in ['cotton', 'wool', 'denim', 'leather', 'nylon', 'linen']},
+    'style_tags': {
+        'vintage': ['vintage'],
+        'rare': ['rare'],
+        'japanese': ['japan'],
+    },
+}
+
+# All buckets share one matcher so a title is scanned once for everything.
+# Labels are interned since they end up as set members and dict keys in
+# every downstream aggregation.
+_TITLE_MATCHER = KeywordMatcher({
+    (bucket, sys.intern(label)): keywords
+    for bucket, labels in _TITLE_VOCABULARY.items()
+    for label, keywords in labels.items()
+})
+
+
+# eBay titles repeat heavily across result pages, so classification is
+# memoized on the lowered title. Results are tuples so cached values
+# can't be mutated by callers.
+@functools.lru_cache(maxsize=8192)
+def _classify_title(title_lower: str) -> tuple:
+    """Return (category, fit, colors, materials, style_tags) for a lowered title."""
+    hits = {bucket: [] for bucket in _TITLE_VOCABULARY}
+    for bucket, label in _TITLE_MATCHER.find(title_lower):
+        hits[bucket].append(label)
+
+    return (
+        hits['category'][0] if hits['category'] else 'other',
+        hits['fit'][0] if hits['fit'] else None,
+        tuple(hits['colors']),
+        tuple(hits['materials']),
+        tuple(hits['style_tags']),
+    )
+
 
 class EbayScraper(BaseScraper):
     """
@@ -63,90 +141,124 @@ class EbayScraper(BaseScraper):
             category: Optional category filter
             max_results: Max items to return
         """
-        # Build search URL
-        search_query = brand_name.replace(' ', '+')
-        url = f"{self.BASE_URL}/sch/i.html?_nkw={search_query}&_sacat=1059"  # Men's clothing category
-
+        # Build search URL once; pages only append _pgn
+        cat_id = '1059'  # Men's clothing category
         if category and category in self.CATEGORIES:
             cat_id = self.CATEGORIES[category].split('/')[-1]
-            url = f"{self.BASE_URL}/sch/i.html?_nkw={search_query}&_sacat={cat_id}"
+        url = f"{self.BASE_URL}/sch/i.html?{urlencode({'_nkw': brand_name, '_sacat': cat_id})}"
 
         logger.info(f"Searching eBay for {brand_name}")
+        brand_lower = brand_name.lower()
         count = 0
         page = 1
 
-        while count < max_results:
-            page_url = url if page == 1 else f"{url}&_pgn={page}"
-            soup = self.fetch_page(page_url)
-            if not soup:
-                break
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = executor.submit(self.fetch_page, url, parse_only=_RESULTS_STRAINER)
 
-            # Find listing items
-            listings = soup.select('.s-item, .srp-results .s-item__wrapper')
-            if not listings:
-                break
+            while count < max_results:
+                soup = pending.result()
+                pending = None
+                if not soup:
+                    break
 
-            found_on_page = 0
-            for listing in listings:
-                if count >= max_results:
+                # Find listing items
+                listings = _LISTING_SELECTOR.select(soup)
+                if not listings:
                     break
 
-                item = self._parse_listing(listing, brand_name)
-                if item:
-                    yield item
-                    count += 1
-                    found_on_page += 1
+                page += 1
+                next_url = f"{url}&_pgn={page}"
+
+                # If this page can't fill max_results on its own, the next page
+                # will be needed, so fetch it while this one is being parsed.
+                # Only once the page has a match, since a page without any
+                # ends the search.
+                prefetch = count + len(listings) < max_results
+
+                found_on_page = 0
+                for listing in listings:
+                    if count >= max_results:
+                        break
+
+                    item = self._parse_listing(listing, brand_name, brand_lower)
+                    if item:
+                        if prefetch and pending is None:
+                            pending = executor.submit(self._fetch_next_page, next_url)
+                        yield item
+                        count += 1
+                        found_on_page += 1
+
+                if found_on_page == 0:
+                    break
 
-            if found_on_page == 0:
-                break
+                if pending is None and count < max_results:
+                    pending = executor.submit(self._fetch_next_page, next_url)
 
-            page += 1
-            time.sleep(1)
+    def _fetch_next_page(self, page_url: str) -> BeautifulSoup | None:
+        """Fetch a follow-up results page, pausing first as between pages."""
+        time.sleep(1)
+        return self.fetch_page(page_url, parse_only=_RESULTS_STRAINER)
+
+    def _parse_listing(
+        self,
+        listing,
+        brand_name: str,
+        brand_lower: Optional[str] = None,
+    ) -> Optional[ClothingItem]:
+        """
+        Parse a single eBay listing.
 
-    def _parse_listing(self, listing, brand_name: str) -> Optional[ClothingItem]:
-        """Parse a single eBay listing."""
+        Args:
+            listing: Listing element from the results page
+            brand_name: Brand being searched for
+            brand_lower: Lowercased brand name, precomputed by callers that
+                parse many listings for the same brand
+        """
         try:
             # Title
-            title_elem = listing.select_one('.s-item__title, .s-item__info a')
+            # Nearly every card has the title class; only fall back to the
+            # broader selector when it's missing
+            title_elem = _TITLE_SELECTOR.select_one(listing) or _TITLE_FALLBACK_SELECTOR.select_one(listing)
             if not title_elem:
                 return None
 
             title = title_elem.get_text(strip=True)
-            if title.lower() == 'shop on ebay':
+            title_lower = title.lower()
+            if title_lower == 'shop on ebay':
                 return None
 
-            # Skip if brand name not in title
-            if brand_name.lower() not in title.lower():
+            # Skip if brand name not in title, before touching the rest of
+            # the listing - most results are rejected here
+            if (brand_lower or brand_name.lower()) not in title_lower:
                 return None
 
             # URL
-            link = listing.find('a', href=True)
+            link = _LINK_SELECTOR.select_one(listing) or listing.find('a', href=True)
             url = link['href'] if link else ""
 
             # Price
-            price_elem = listing.select_one('.s-item__price')
+            price_elem = _PRICE_SELECTOR.select_one(listing)
             price = None
             if price_elem:
                 price_text = price_elem.get_text(strip=True)
                 # Extract first price if range
-                price_match = re.search(r'\$(\d+(?:\.\d{2})?)', price_text)
+                price_match = _PRICE_RE.search(price_text)
                 if price_match:
                     price = float(price_match.group(1))
 
-            # Parse item details from title
-            category = self._infer_category(title)
-            attrs = self._parse_attributes(title)
+            # Parse item details from the already-lowered title
+            category, fit, colors, materials, style_tags = _classify_title(title_lower)
 
             return ClothingItem(
-                id=str(uuid.uuid4()),
+                id=uuid.uuid4().hex,
                 name=title,
                 brand=brand_name,
                 category=category,
                 description=title,
-                fit=attrs.get('fit'),
-                style_tags=attrs.get('style_tags', []),
-                colors=attrs.get('colors', []),
-                materials=attrs.get('materials', []),
+                fit=fit,
+                style_tags=list(style_tags),
+                colors=list(colors),
+                materials=list(materials),
                 source_url=url,
                 source_type="ebay",
                 price_usd=price,
@@ -158,69 +270,17 @@ class EbayScraper(BaseScraper):
 
     def _infer_category(self, title: str) -> str:
         """Infer category from title."""
-        title_lower = title.lower()
-
-        categories = {
-            'jacket': ['jacket', 'coat', 'blazer', 'parka', 'bomber'],
-            'pants': ['pants', 'trousers', 'chinos', 'slacks'],
-            'jeans': ['jeans', 'denim pants', 'jean'],
-            'shirt': ['shirt', 'button up', 'oxford', 'flannel'],
-            't-shirt': ['t-shirt', 'tee', 'tshirt'],
-            'sweater': ['sweater', 'cardigan', 'knit', 'pullover'],
-            'hoodie': ['hoodie', 'hooded', 'sweatshirt'],
-            'shorts': ['shorts'],
-            'shoes': ['shoes', 'boots', 'sneakers', 'loafers'],
-        }
-
-        for cat, keywords in categories.items():
-            if any(kw in title_lower for kw in keywords):
-                return cat
-
-        return 'other'
+        return _classify_title(title.lower())[0]
 
     def _parse_attributes(self, title: str) -> dict:
         """Parse style attributes from listing title."""
-        title_lower = title.lower()
-
-        # Fit
-        fit = None
-        if 'slim' in title_lower:
-            fit = 'slim'
-        elif 'relaxed' in title_lower:
-            fit = 'relaxed'
-        elif 'oversized' in title_lower:
-            fit = 'oversized'
-        elif 'tapered' in title_lower:
-            fit = 'tapered'
-
-        # Colors
-        colors = []
-        color_words = ['black', 'navy', 'blue', 'grey', 'olive', 'khaki', 'white', 'brown', 'indigo']
-        for color in color_words:
-            if color in title_lower:
-                colors.append(color)
-
-        # Materials
-        materials = []
-        material_words = ['cotton', 'wool', 'denim', 'leather', 'nylon', 'linen']
-        for mat in material_words:
-            if mat in title_lower:
-                materials.append(mat)
-
-        # Style tags
-        style_tags = []
-        if 'vintage' in title_lower:
-            style_tags.append('vintage')
-        if 'rare' in title_lower:
-            style_tags.append('rare')
-        if 'japan' in title_lower:
-            style_tags.append('japanese')
+        _, fit, colors, materials, style_tags = _classify_title(title.lower())
 
         return {
             'fit': fit,
-            'colors': colors,
-            'materials': materials,
-            'style_tags': style_tags,
+            'colors': list(colors),
+            'materials': list(materials),
+            'style_tags': list(style_tags),
         }
 
     def find_missing_brands(
@@ -238,13 +298,11 @@ class EbayScraper(BaseScraper):
             min_items_per_brand: Minimum items needed per brand
         """
         # Count existing items per brand
-        brand_counts = {}
-        for item in existing_items:
-            brand_counts[item.brand] = brand_counts.get(item.brand, 0) + 1
+        brand_counts = Counter(sys.intern(item.brand) for item in existing_items)
 
         # Find underrepresented brands
         for brand in brand_list:
-            current_count = brand_counts.get(brand, 0)
+            current_count = brand_counts[brand]
             if current_count < min_items_per_brand:
                 needed = min_items_per_brand - current_count
                 logger.info(f"Searching eBay for {brand} (have {current_count}, need {needed} more)")
@@ -258,9 +316,9 @@ class EbayScraper(BaseScraper):
         """
         # Parse brand from URL if possible
         if 'nkw=' in url:
-            brand_match = re.search(r'nkw=([^&]+)', url)
+            brand_match = _NKW_RE.search(url)
             if brand_match:
-                brand_name = brand_match.group(1).replace('+', ' ')
+                brand_name = unquote_plus(brand_match.group(1))
                 for item in self.search_brand(brand_name):
                     yield item
 
@@ -268,23 +326,24 @@ class EbayScraper(BaseScraper):
         """
         eBay doesn't have brand pages, but we can infer info from listings.
         """
-        items = list(self.search_brand(brand_name, max_results=20))
-        if not items:
-            return None
-
-        # Aggregate info from items
+        # Aggregate info from items as they are yielded
         all_categories = set()
         all_colors = set()
         all_materials = set()
         prices = []
+        found_any = False
 
-        for item in items:
+        for item in self.search_brand(brand_name, max_results=20):
+            found_any = True
             all_categories.add(item.category)
             all_colors.update(item.colors)
             all_materials.update(item.materials)
             if item.price_usd:
                 prices.append(item.price_usd)
 
+        if not found_any:
+            return None
+
         # Determine price range
         price_range = 'mid'
         if prices:
@@ -297,10 +356,10 @@ class EbayScraper(BaseScraper):
                 price_range = 'budget'
 
         return Brand(
-            id=str(uuid.uuid4()),
+            id=uuid.uuid4().hex,
             name=brand_name,
-            description=f"Brand found via eBay listings. Known for {', '.join(list(all_categories)[:3])}.",
-            aesthetics=list(all_materials)[:5],
+            description=f"Brand found via eBay listings. Known for {', '.join(islice(all_categories, 3))}.",
+            aesthetics=list(islice(all_materials, 5)),
             typical_fits=[],
             price_range=price_range,
             origin_country=None,
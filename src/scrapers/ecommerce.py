@@ -8,11 +8,81 @@ Many sites have APIs you should use instead when available.
 import re
 import uuid
 from typing import Generator, Optional
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
 
-from .base import BaseScraper
+from .base import BaseScraper, json_loads
+from .keywords import KeywordMatcher
 from ..models.clothing import ClothingItem, Brand
 
+# Patterns used on every scraped product, compiled once at import
+_PRICE_RE = re.compile(r'[\$£€]?\s*(\d+(?:\.\d{2})?)')
+_FIT_RE = re.compile(r'\b(slim|skinny|tapered|straight|relaxed|loose|oversized|regular|wide)\s*(fit|cut|leg)?\b')
+_RISE_RE = re.compile(r'\b(high|mid|low)\s*rise\b')
+
+# Keyword vocabularies, each matched against the text in a single scan
+_COLOR_MATCHER = KeywordMatcher([
+    'black', 'white', 'navy', 'blue', 'grey', 'gray', 'charcoal',
+    'olive', 'green', 'khaki', 'tan', 'brown', 'beige', 'cream',
+    'burgundy', 'maroon', 'red', 'orange', 'yellow', 'indigo',
+    'earth tone', 'neutral',
+])
+_MATERIAL_MATCHER = KeywordMatcher([
+    'cotton', 'denim', 'wool', 'linen', 'polyester', 'nylon',
+    'canvas', 'twill', 'corduroy', 'flannel', 'chambray',
+    'selvedge', 'raw denim', 'heavyweight', 'lightweight',
+])
+_STYLE_MATCHER = KeywordMatcher({
+    'workwear': ['workwear', 'work wear', 'utility', 'chore'],
+    'minimalist': ['minimal', 'clean lines', 'simple'],
+    'streetwear': ['streetwear', 'street wear', 'urban'],
+    'heritage': ['heritage', 'vintage', 'classic', 'traditional'],
+    'techwear': ['technical', 'techwear', 'tech wear', 'waterproof'],
+    'japanese': ['japanese', 'japan'],
+    'scandinavian': ['scandinavian', 'nordic', 'scandi'],
+    'americana': ['americana', 'american', 'western'],
+    'military': ['military', 'surplus', 'army', 'cargo'],
+})
+# Checked in priority order; the first matching category wins
+_CATEGORY_MATCHER = KeywordMatcher({
+    'pants': ['pants', 'trousers', 'jeans', 'chinos', 'slacks'],
+    'jacket': ['jacket', 'coat', 'blazer', 'outerwear'],
+    'shirt': ['shirt', 'button-down', 'oxford', 'flannel shirt'],
+    'sweater': ['sweater', 'knit', 'cardigan', 'pullover'],
+    't-shirt': ['t-shirt', 'tee', 'tshirt'],
+    'hoodie': ['hoodie', 'hooded sweatshirt'],
+    'shorts': ['shorts'],
+    'shoes': ['shoes', 'boots', 'sneakers', 'footwear'],
+})
+
+# Product card fields, identified by (classes, tag names). Adjust for
+# specific sites as needed.
+_PRODUCT_FIELDS = {
+    'name': ({'product-name', 'product-title'}, {'h3', 'h4'}),
+    'brand': ({'product-brand', 'brand'}, set()),
+    'description': ({'product-description', 'description'}, set()),
+    'price': ({'price', 'product-price'}, set()),
+}
+
+
+def _find_product_fields(product_elem: Tag) -> dict:
+    """
+    Locate each product field in a single walk over the card.
+
+    Like select_one, the first matching descendant in document order wins
+    for each field; the walk stops once every field has been found.
+    """
+    fields = {}
+    for elem in product_elem.descendants:
+        if not isinstance(elem, Tag):
+            continue
+        classes = elem.get('class') or ()
+        for field, (field_classes, tags) in _PRODUCT_FIELDS.items():
+            if field not in fields and (elem.name in tags or not field_classes.isdisjoint(classes)):
+                fields[field] = elem
+        if len(fields) == len(_PRODUCT_FIELDS):
+            break
+    return fields
+
 
 class GenericEcommerceScraper(BaseScraper):
     """
@@ -31,84 +101,47 @@ class GenericEcommerceScraper(BaseScraper):
         """
         import json
 
-        schema_script = soup.find('script', type='application/ld+json')
-        if schema_script:
+        # Pages often carry several LD+JSON blocks (breadcrumbs, organization,
+        # product); stop at the first Product found
+        for schema_script in soup.find_all('script', type='application/ld+json'):
             try:
-                data = json.loads(schema_script.string)
-                if isinstance(data, list):
-                    # Find product schema in list
-                    for item in data:
-                        if item.get('@type') == 'Product':
-                            return item
-                elif data.get('@type') == 'Product':
-                    return data
-            except json.JSONDecodeError:
-                pass
+                data = json_loads(schema_script.string)
+            except (json.JSONDecodeError, TypeError):
+                continue
+
+            for item in (data if isinstance(data, list) else [data]):
+                if isinstance(item, dict) and item.get('@type') == 'Product':
+                    return item
         return None
 
-    def parse_product_description(self, description: str) -> dict:
+    def parse_product_description(self, description: str, description_lower: Optional[str] = None) -> dict:
         """
         Extract style attributes from product description text.
         Uses pattern matching for common menswear terminology.
+
+        Args:
+            description: Product description text
+            description_lower: Lowercased description, if the caller already has it
         """
-        description_lower = description.lower()
+        if description_lower is None:
+            description_lower = description.lower()
 
-        # Fit patterns
-        fits = []
-        fit_patterns = [
-            r'\b(slim|skinny|tapered|straight|relaxed|loose|oversized|regular|wide)\s*(fit|cut|leg)?\b',
-            r'\b(high|mid|low)\s*rise\b',
-        ]
-        for pattern in fit_patterns:
-            matches = re.findall(pattern, description_lower)
-            fits.extend([' '.join(m).strip() for m in matches])
-
-        # Color patterns
-        colors = []
-        color_words = [
-            'black', 'white', 'navy', 'blue', 'grey', 'gray', 'charcoal',
-            'olive', 'green', 'khaki', 'tan', 'brown', 'beige', 'cream',
-            'burgundy', 'maroon', 'red', 'orange', 'yellow', 'indigo',
-            'earth tone', 'neutral',
-        ]
-        for color in color_words:
-            if color in description_lower:
-                colors.append(color)
-
-        # Material patterns
-        materials = []
-        material_words = [
-            'cotton', 'denim', 'wool', 'linen', 'polyester', 'nylon',
-            'canvas', 'twill', 'corduroy', 'flannel', 'chambray',
-            'selvedge', 'raw denim', 'heavyweight', 'lightweight',
-        ]
-        for material in material_words:
-            if material in description_lower:
-                materials.append(material)
-
-        # Style tags
-        style_tags = []
-        style_keywords = {
-            'workwear': ['workwear', 'work wear', 'utility', 'chore'],
-            'minimalist': ['minimal', 'clean lines', 'simple'],
-            'streetwear': ['streetwear', 'street wear', 'urban'],
-            'heritage': ['heritage', 'vintage', 'classic', 'traditional'],
-            'techwear': ['technical', 'techwear', 'tech wear', 'waterproof'],
-            'japanese': ['japanese', 'japan'],
-            'scandinavian': ['scandinavian', 'nordic', 'scandi'],
-            'americana': ['americana', 'american', 'western'],
-            'military': ['military', 'surplus', 'army', 'cargo'],
-        }
+        # Fit patterns. _FIT_RE yields (fit, suffix) pairs; _RISE_RE has a
+        # single group, so findall yields plain strings
+        fits = [' '.join(m).strip() for m in _FIT_RE.findall(description_lower)]
+        fits.extend(f"{rise} rise" for rise in _RISE_RE.findall(description_lower))
 
-        for tag, keywords in style_keywords.items():
-            if any(kw in description_lower for kw in keywords):
-                style_tags.append(tag)
+        colors = _COLOR_MATCHER.find(description_lower)
+        materials = _MATERIAL_MATCHER.find(description_lower)
+        style_tags = _STYLE_MATCHER.find(description_lower)
 
+        # Matcher results are already unique; fits can repeat and are
+        # deduplicated in first-seen order
         return {
-            'fits': list(set(fits)),
-            'colors': list(set(colors)),
-            'materials': list(set(materials)),
-            'style_tags': list(set(style_tags)),
+            'fits': list(dict.fromkeys(fits)),
+            'colors': colors,
+            'materials': materials,
+            'style_tags': style_tags,
         }
 
     def scrape_products(self, url: str) -> Generator[ClothingItem, None, None]:
@@ -135,72 +168,55 @@ class GenericEcommerceScraper(BaseScraper):
                 break
 
         for product_elem in products:
-            try:
-                # Extract basic info (adjust selectors as needed)
-                name_elem = product_elem.select_one('.product-name, .product-title, h3, h4')
-                brand_elem = product_elem.select_one('.product-brand, .brand')
-                desc_elem = product_elem.select_one('.product-description, .description')
-                price_elem = product_elem.select_one('.price, .product-price')
-
-                if not name_elem:
-                    continue
-
-                name = name_elem.get_text(strip=True)
-                brand = brand_elem.get_text(strip=True) if brand_elem else "Unknown"
-                description = desc_elem.get_text(strip=True) if desc_elem else name
-
-                # Parse description for style attributes
-                attrs = self.parse_product_description(description)
-
-                # Determine category from name/description
-                category = self._infer_category(name + " " + description)
-
-                # Parse price if available
-                price = None
-                if price_elem:
-                    price_text = price_elem.get_text(strip=True)
-                    price_match = re.search(r'[\$£€]?\s*(\d+(?:\.\d{2})?)', price_text)
-                    if price_match:
-                        price = float(price_match.group(1))
-
-                yield ClothingItem(
-                    id=str(uuid.uuid4()),
-                    name=name,
-                    brand=brand,
-                    category=category,
-                    description=description,
-                    fit=attrs['fits'][0] if attrs['fits'] else None,
-                    style_tags=attrs['style_tags'],
-                    colors=attrs['colors'],
-                    materials=attrs['materials'],
-                    source_url=url,
-                    source_type="scraped",
-                    price_usd=price,
-                )
-
-            except Exception as e:
+            # Extract basic info (adjust _PRODUCT_FIELDS as needed)
+            fields = _find_product_fields(product_elem)
+            name_elem = fields.get('name')
+            brand_elem = fields.get('brand')
+            desc_elem = fields.get('description')
+            price_elem = fields.get('price')
+
+            if not name_elem:
                 continue
 
+            name = name_elem.get_text(strip=True)
+            brand = brand_elem.get_text(strip=True) if brand_elem else "Unknown"
+            description = desc_elem.get_text(strip=True) if desc_elem else name
+
+            # Lower once and share it between the attribute and category scans
+            description_lower = description.lower()
+
+            # Parse description for style attributes
+            attrs = self.parse_product_description(description, description_lower)
+
+            # Determine category from name/description
+            category = _CATEGORY_MATCHER.first(f"{name.lower()} {description_lower}", 'other')
+
+            # Parse price if available
+            price = None
+            if price_elem:
+                price_text = price_elem.get_text(strip=True)
+                price_match = _PRICE_RE.search(price_text)
+                if price_match:
+                    price = float(price_match.group(1))
+
+            yield ClothingItem(
+                id=uuid.uuid4().hex,
+                name=name,
+                brand=brand,
+                category=category,
+                description=description,
+                fit=attrs['fits'][0] if attrs['fits'] else None,
+                style_tags=attrs['style_tags'],
+                colors=attrs['colors'],
+                materials=attrs['materials'],
+                source_url=url,
+                source_type="scraped",
+                price_usd=price,
+            )
+
     def _infer_category(self, text: str) -> str:
         """Infer clothing category from text."""
-        text_lower = text.lower()
-
-        category_keywords = {
-            'pants': ['pants', 'trousers', 'jeans', 'chinos', 'slacks'],
-            'jacket': ['jacket', 'coat', 'blazer', 'outerwear'],
-            'shirt': ['shirt', 'button-down', 'oxford', 'flannel shirt'],
-            'sweater': ['sweater', 'knit', 'cardigan', 'pullover'],
-            't-shirt': ['t-shirt', 'tee', 'tshirt'],
-            'hoodie': ['hoodie', 'hooded sweatshirt'],
-            'shorts': ['shorts'],
-            'shoes': ['shoes', 'boots', 'sneakers', 'footwear'],
-        }
-
-        for category, keywords in category_keywords.items():
-            if any(kw in text_lower for kw in keywords):
-                return category
-
-        return 'other'
+        return _CATEGORY_MATCHER.first(text.lower(), 'other')
 
     def scrape_brand_info(self, brand_name: str) -> Optional[Brand]:
         """
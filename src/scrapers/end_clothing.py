@@ -9,19 +9,141 @@ IMPORTANT:
 - Use for research/educational purposes only
 - Check Terms of Service before use
 """
+import hashlib
 import json
+import os
 import re
+import threading
 import time
-import uuid
-from typing import Generator, Optional, List
-from bs4 import BeautifulSoup
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Generator, Iterator, Optional, List
+from urllib.parse import urlparse
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve
 import logging
 
-from .base import BaseScraper
+from .base import BaseScraper, class_strainer, iterate_concurrently, json_loads
+from .keywords import KeywordMatcher
 from ..models.clothing import ClothingItem, Brand
 
 logger = logging.getLogger(__name__)
 
+# Listing pages are only read for their product cards, so nothing else is
+# built into the tree. The class-based strainer matches the older markup
+# and is only used when the data-test-id cards aren't present. Like the
+# CSS '.product-card, [class*="ProductCard"]', it takes any element with a
+# product-card class or a class containing ProductCard (including hashed
+# CSS-module names such as ProductCard_root__x1).
+_PRODUCT_CARD_STRAINER = SoupStrainer(attrs={'data-test-id': 'ProductCard'})
+_PRODUCT_CARD_CLASS_RE = re.compile(r'^product-card$|ProductCard')
+_PRODUCT_CARD_FALLBACK_STRAINER = class_strainer(_PRODUCT_CARD_CLASS_RE.search)
+
+# Substring class matches, equivalent to CSS [class*="..."]. Lookups use
+# find() with these rather than CSS selectors, which avoids soupsieve for
+# simple single-attribute matches.
+_BRAND_CLASS_RE = re.compile('brand')
+_DESCRIPTION_CLASS_RE = re.compile('description')
+_COMPOSITION_CLASS_RE = re.compile('composition')
+_BRAND_DESCRIPTION_CLASS_RE = re.compile('brand-description')
+
+# The brand index needs a descendant combinator, so it stays a CSS selector,
+# compiled once
+_BRAND_LINK_SELECTOR = soupsieve.compile('.brand-list a, [class*="brand"] a')
+
+# Patterns used on every product, compiled once at import
+_PRICE_RE = re.compile(r'\$(\d+(?:\.\d{2})?)')
+
+# Checked in order; the first matching fit wins
+_FIT_PATTERNS = [
+    (re.compile(r'\bslim\s*(?:fit|tapered?)\b'), 'slim tapered'),
+    (re.compile(r'\bslim\s*fit\b'), 'slim'),
+    (re.compile(r'\btapered?\s*(?:fit|leg)?\b'), 'tapered'),
+    (re.compile(r'\brelaxed\s*(?:fit|tapered?)?\b'), 'relaxed'),
+    (re.compile(r'\boversized?\b'), 'oversized'),
+    (re.compile(r'\bwide\s*(?:leg|fit)?\b'), 'wide'),
+    (re.compile(r'\bstraight\s*(?:leg|fit)?\b'), 'straight'),
+    (re.compile(r'\bregular\s*fit\b'), 'regular'),
+    (re.compile(r'\bhigh\s*rise\b'), 'high rise'),
+    (re.compile(r'\bmid\s*rise\b'), 'mid rise'),
+    (re.compile(r'\blow\s*rise\b'), 'low rise'),
+]
+
+# Whole-word color names, matched in one pass
+_COLOR_WORDS = [
+    'black', 'white', 'navy', 'blue', 'grey', 'gray', 'charcoal',
+    'olive', 'green', 'khaki', 'tan', 'brown', 'beige', 'cream',
+    'burgundy', 'red', 'indigo', 'ecru', 'stone', 'camel',
+]
+_COLOR_RE = re.compile(rf"\b({'|'.join(_COLOR_WORDS)})\b")
+
+# Materials and style tags are plain substring matches, so both share one
+# keyword scan; hits come back as (bucket, label) pairs
+_MATERIAL_WORDS = [
+    'cotton', 'denim', 'wool', 'linen', 'polyester', 'nylon',
+    'canvas', 'twill', 'corduroy', 'flannel', 'chambray',
+    'selvedge', 'silk', 'cashmere', 'leather', 'suede',
+    'gore-tex', 'ripstop', 'fleece', 'jersey',
+]
+_STYLE_MAPPINGS = {
+    'workwear': ['workwear', 'work wear', 'utility', 'chore', 'fatigue'],
+    'minimalist': ['minimal', 'clean', 'simple'],
+    'streetwear': ['streetwear', 'street', 'urban'],
+    'heritage': ['heritage', 'vintage', 'classic', 'traditional'],
+    'techwear': ['technical', 'techwear', 'tech', 'waterproof', 'gore-tex'],
+    'japanese': ['japanese', 'japan', 'tokyo'],
+    'scandinavian': ['scandinavian', 'nordic', 'danish', 'swedish'],
+    'americana': ['americana', 'american', 'western', 'usa'],
+    'military': ['military', 'army', 'cargo', 'fatigue'],
+    'contemporary': ['contemporary', 'modern'],
+    'luxury': ['luxury', 'premium', 'designer'],
+}
+_KEYWORD_MATCHER = KeywordMatcher({
+    **{('materials', material): [material] for material in _MATERIAL_WORDS},
+    **{('style_tags', tag): keywords for tag, keywords in _STYLE_MAPPINGS.items()},
+})
+
+
+def _url_id(url: str) -> str:
+    """
+    Derive a stable ID from a page URL.
+
+    Re-crawling the same product or brand page yields the same ID, so
+    downstream stores can upsert instead of accumulating duplicates.
+    """
+    return hashlib.blake2b(url.encode(), digest_size=12).hexdigest()
+
+
+def _match_fit(text: str) -> Optional[str]:
+    """Return the first fit pattern found in text, or None."""
+    for pattern, fit_name in _FIT_PATTERNS:
+        if pattern.search(text):
+            return fit_name
+    return None
+
+
+def _schema_style_fields(schema_data: dict) -> dict:
+    """
+    Pull color, material and fit text out of a JSON-LD Product.
+
+    Returns lowercased text keyed by 'color', 'material' and 'fit'; fields
+    the schema doesn't carry are omitted.
+    """
+    fields = {}
+    for key in ('color', 'material'):
+        value = schema_data.get(key)
+        if isinstance(value, list):
+            value = ' '.join(str(v) for v in value)
+        if isinstance(value, str) and value.strip():
+            fields[key] = value.lower()
+
+    for prop in schema_data.get('additionalProperty') or []:
+        if isinstance(prop, dict) and str(prop.get('name', '')).lower() == 'fit' and prop.get('value'):
+            fields['fit'] = str(prop['value']).strip().lower()
+            break
+
+    return fields
+
 
 class EndClothingScraper(BaseScraper):
     """
@@ -45,8 +167,24 @@ class EndClothingScraper(BaseScraper):
         'hoodies': '/us/men/clothing/sweatshirts',
         'footwear': '/us/men/footwear',
     }
+    # Category paths without their leading '/us/' locale segment
+    _PATH_TO_CATEGORY = {path.strip('/').split('/', 1)[1]: cat for cat, path in CATEGORIES.items()}
+
+    # Product detail pages fetched concurrently per category
+    DETAIL_WORKERS = 4
+
+    # Write crawl progress after this many products
+    CHECKPOINT_EVERY = 25
 
-    def __init__(self, **kwargs):
+    def __init__(self, checkpoint_path: Optional[str] = None, resume: bool = False, **kwargs):
+        """
+        Args:
+            checkpoint_path: File to record crawl progress in, or None to
+                disable checkpointing
+            resume: Load progress from checkpoint_path and skip listing pages
+                and products already scraped
+        """
+        kwargs.setdefault('max_retries', 3)
         super().__init__(delay_seconds=3.0, **kwargs)  # Slower to avoid detection
         # More browser-like headers
         self.session.headers.update({
@@ -64,6 +202,76 @@ class EndClothingScraper(BaseScraper):
         self.scraped_products = []
         self.discovered_brands = set()
 
+        # Per-category crawl progress: the listing page reached, the
+        # product URLs already scraped and the failed ones with their page
+        self.checkpoint_path = checkpoint_path
+        self._progress: dict = {}
+        self._progress_lock = threading.Lock()
+        self._unsaved_progress = 0
+        if checkpoint_path and resume:
+            self._load_progress()
+
+    def _load_progress(self):
+        """Load crawl progress from the checkpoint file, if present."""
+        try:
+            with open(self.checkpoint_path, 'r') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable crawl checkpoint {self.checkpoint_path}: {e}")
+            return
+
+        self._progress = {
+            category: {
+                'page': entry.get('page', 1),
+                'urls': set(entry.get('urls', [])),
+                'failed': dict(entry.get('failed', {})),
+            }
+            for category, entry in data.items()
+        }
+        done = sum(len(entry['urls']) for entry in self._progress.values())
+        logger.info(f"Resuming End crawl: {done} products already scraped")
+
+    def _record_progress(self, category: str, page: int, url: str, scraped: bool):
+        """Record a consumed listing entry, saving every CHECKPOINT_EVERY products."""
+        if not self.checkpoint_path:
+            return
+
+        with self._progress_lock:
+            entry = self._progress.setdefault(category, {'page': 1, 'urls': set(), 'failed': {}})
+            entry['page'] = max(entry['page'], page)
+            if scraped:
+                entry['urls'].add(url)
+                entry['failed'].pop(url, None)
+            else:
+                # Kept with its page so a resume restarts early enough to retry it
+                entry['failed'][url] = page
+            self._unsaved_progress += 1
+            if self._unsaved_progress >= self.CHECKPOINT_EVERY:
+                self._save_progress()
+
+    def _clear_progress(self, category: str):
+        """Forget a finished category, so a later resume crawls it afresh."""
+        if not self.checkpoint_path:
+            return
+
+        with self._progress_lock:
+            if self._progress.pop(category, None) is not None:
+                self._save_progress()
+
+    def _save_progress(self):
+        """Atomically write crawl progress. Callers hold _progress_lock."""
+        data = {
+            category: {'page': entry['page'], 'urls': sorted(entry['urls']), 'failed': entry['failed']}
+            for category, entry in self._progress.items()
+        }
+        tmp_path = f"{self.checkpoint_path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.checkpoint_path)
+        self._unsaved_progress = 0
+
     def get_category_url(self, category: str, page: int = 1) -> str:
         """Build URL for category listing with pagination."""
         base_path = self.CATEGORIES.get(category, category)
@@ -82,15 +290,19 @@ class EndClothingScraper(BaseScraper):
         Yields:
             Dictionary with product URLs and basic info
         """
-        page = 1
+        # When resuming, restart from the last page that had products in
+        # progress, or from the earliest page with a failed product so it is
+        # retried; products already scraped are skipped by _scrape_details
+        progress = self._progress.get(category, {})
+        page = min(progress.get('failed', {}).values(), default=progress.get('page', 1))
         consecutive_empty = 0
 
         while page <= max_pages:
             url = self.get_category_url(category, page)
             logger.info(f"Scraping {category} page {page}: {url}")
 
-            soup = self.fetch_page(url)
-            if not soup:
+            html = self.fetch_html(url)
+            if not html:
                 consecutive_empty += 1
                 if consecutive_empty >= 3:
                     break
@@ -98,10 +310,17 @@ class EndClothingScraper(BaseScraper):
                 continue
 
             # Find product cards
-            products = soup.select('[data-test-id="ProductCard"]')
+            soup = BeautifulSoup(html, 'lxml', parse_only=_PRODUCT_CARD_STRAINER)
+            products = soup.find_all(attrs={'data-test-id': 'ProductCard'})
             if not products:
                 # Try alternative selectors
-                products = soup.select('.product-card, .ProductCard, [class*="ProductCard"]')
+                soup = BeautifulSoup(html, 'lxml', parse_only=_PRODUCT_CARD_FALLBACK_STRAINER)
+                # Parts of a card can match too (ProductCard__image); only the
+                # outermost match is the card itself
+                products = [
+                    card for card in soup.find_all(class_=_PRODUCT_CARD_CLASS_RE)
+                    if card.find_parent(class_=_PRODUCT_CARD_CLASS_RE) is None
+                ]
 
             if not products:
                 consecutive_empty += 1
@@ -125,19 +344,29 @@ class EndClothingScraper(BaseScraper):
                         product_url = self.BASE_URL + product_url
 
                     # Extract brand from listing
-                    brand_elem = product.select_one('[data-test-id="ProductCard__brand"], .brand, [class*="brand"]')
+                    brand_elem = (
+                        product.find(attrs={'data-test-id': 'ProductCard__brand'})
+                        or product.find(class_=_BRAND_CLASS_RE)
+                    )
                     brand = brand_elem.get_text(strip=True) if brand_elem else "Unknown"
 
                     # Extract name
-                    name_elem = product.select_one('[data-test-id="ProductCard__name"], .product-name, h3')
+                    name_elem = (
+                        product.find(attrs={'data-test-id': 'ProductCard__name'})
+                        or product.find(class_='product-name')
+                        or product.find('h3')
+                    )
                     name = name_elem.get_text(strip=True) if name_elem else "Unknown"
 
                     # Extract price
-                    price_elem = product.select_one('[data-test-id="ProductCard__price"], .price')
+                    price_elem = (
+                        product.find(attrs={'data-test-id': 'ProductCard__price'})
+                        or product.find(class_='price')
+                    )
                     price = None
                     if price_elem:
                         price_text = price_elem.get_text(strip=True)
-                        price_match = re.search(r'\$(\d+(?:\.\d{2})?)', price_text)
+                        price_match = _PRICE_RE.search(price_text)
                         if price_match:
                             price = float(price_match.group(1))
 
@@ -149,6 +378,7 @@ class EndClothingScraper(BaseScraper):
                         'name': name,
                         'price': price,
                         'category': category,
+                        'page': page,
                     }
 
                 except Exception as e:
@@ -180,27 +410,27 @@ class EndClothingScraper(BaseScraper):
 
             # Get description
             description = ""
-            desc_elem = soup.select_one('[data-test-id="product-description"], .product-description, [class*="description"]')
+            desc_elem = (
+                soup.find(attrs={'data-test-id': 'product-description'})
+                or soup.find(class_=_DESCRIPTION_CLASS_RE)
+            )
             if desc_elem:
                 description = desc_elem.get_text(strip=True)
             elif schema_data and 'description' in schema_data:
                 description = schema_data['description']
 
-            # Parse style attributes from description
-            attrs = self._parse_style_attributes(description, product_info['name'])
+            # Parse style attributes, preferring structured schema fields
+            attrs = self._parse_style_attributes(description, product_info['name'], schema_data)
 
             # Extract additional details
             details = self._extract_product_details(soup)
 
-            # Combine materials
-            materials = attrs['materials']
-            if details.get('composition'):
-                materials.extend(details['composition'])
-            materials = list(set(materials))
+            # Combine materials, keeping first-seen order
+            materials = list(dict.fromkeys(attrs['materials'] + details['composition']))
 
             # Build ClothingItem
             item = ClothingItem(
-                id=str(uuid.uuid4()),
+                id=_url_id(url),
                 name=product_info['name'],
                 brand=product_info['brand'],
                 category=product_info['category'],
@@ -221,93 +451,79 @@ class EndClothingScraper(BaseScraper):
             return None
 
     def _extract_schema_data(self, soup: BeautifulSoup) -> dict:
-        """Extract product data from JSON-LD schema."""
-        scripts = soup.find_all('script', type='application/ld+json')
-        for script in scripts:
+        """
+        Extract product data from JSON-LD schema.
+
+        Called once per product page; scrape_product_detail passes the result
+        on to attribute parsing rather than extracting it again.
+        """
+        for script in soup.find_all('script', type='application/ld+json'):
+            text = script.string
+            # Breadcrumb/WebSite blocks usually come first; skip parsing any
+            # block that can't contain a Product
+            if not text or '"Product"' not in text:
+                continue
+
             try:
-                data = json.loads(script.string)
-                if isinstance(data, list):
-                    for item in data:
-                        if item.get('@type') == 'Product':
-                            return item
-                elif data.get('@type') == 'Product':
-                    return data
-            except (json.JSONDecodeError, TypeError):
+                data = json_loads(text)
+            except json.JSONDecodeError:
                 continue
+
+            for item in (data if isinstance(data, list) else [data]):
+                if isinstance(item, dict) and item.get('@type') == 'Product':
+                    return item
         return {}
 
-    def _parse_style_attributes(self, description: str, name: str) -> dict:
-        """Parse style attributes from product description."""
+    def _parse_style_attributes(self, description: str, name: str, schema_data: Optional[dict] = None) -> dict:
+        """
+        Parse style attributes from product description.
+
+        Args:
+            description: Product description text
+            name: Product name
+            schema_data: JSON-LD Product data, if the page had one. Its color,
+                material and fit fields are used in place of scanning the
+                description; the description is still scanned for any field
+                the schema doesn't resolve.
+        """
         text = f"{name} {description}".lower()
+        schema_fields = _schema_style_fields(schema_data) if schema_data else {}
 
         # Fit detection
         fit = None
-        fit_patterns = [
-            (r'\bslim\s*(?:fit|tapered?)\b', 'slim tapered'),
-            (r'\bslim\s*fit\b', 'slim'),
-            (r'\btapered?\s*(?:fit|leg)?\b', 'tapered'),
-            (r'\brelaxed\s*(?:fit|tapered?)?\b', 'relaxed'),
-            (r'\boversized?\b', 'oversized'),
-            (r'\bwide\s*(?:leg|fit)?\b', 'wide'),
-            (r'\bstraight\s*(?:leg|fit)?\b', 'straight'),
-            (r'\bregular\s*fit\b', 'regular'),
-            (r'\bhigh\s*rise\b', 'high rise'),
-            (r'\bmid\s*rise\b', 'mid rise'),
-            (r'\blow\s*rise\b', 'low rise'),
-        ]
-        for pattern, fit_name in fit_patterns:
-            if re.search(pattern, text):
-                fit = fit_name
-                break
+        if 'fit' in schema_fields:
+            fit = _match_fit(schema_fields['fit']) or schema_fields['fit']
+        if fit is None:
+            fit = _match_fit(text)
 
         # Color detection
-        colors = []
-        color_words = [
-            'black', 'white', 'navy', 'blue', 'grey', 'gray', 'charcoal',
-            'olive', 'green', 'khaki', 'tan', 'brown', 'beige', 'cream',
-            'burgundy', 'red', 'indigo', 'ecru', 'stone', 'camel',
-        ]
-        for color in color_words:
-            if re.search(rf'\b{color}\b', text):
-                colors.append(color)
-
-        # Material detection
+        colors = _COLOR_RE.findall(schema_fields['color']) if 'color' in schema_fields else []
+        if not colors:
+            colors = _COLOR_RE.findall(text)
+
+        # Materials and style tags
         materials = []
-        material_words = [
-            'cotton', 'denim', 'wool', 'linen', 'polyester', 'nylon',
-            'canvas', 'twill', 'corduroy', 'flannel', 'chambray',
-            'selvedge', 'silk', 'cashmere', 'leather', 'suede',
-            'gore-tex', 'ripstop', 'fleece', 'jersey',
-        ]
-        for material in material_words:
-            if material in text:
-                materials.append(material)
-
-        # Style tags
         style_tags = []
-        style_mappings = {
-            'workwear': ['workwear', 'work wear', 'utility', 'chore', 'fatigue'],
-            'minimalist': ['minimal', 'clean', 'simple'],
-            'streetwear': ['streetwear', 'street', 'urban'],
-            'heritage': ['heritage', 'vintage', 'classic', 'traditional'],
-            'techwear': ['technical', 'techwear', 'tech', 'waterproof', 'gore-tex'],
-            'japanese': ['japanese', 'japan', 'tokyo'],
-            'scandinavian': ['scandinavian', 'nordic', 'danish', 'swedish'],
-            'americana': ['americana', 'american', 'western', 'usa'],
-            'military': ['military', 'army', 'cargo', 'fatigue'],
-            'contemporary': ['contemporary', 'modern'],
-            'luxury': ['luxury', 'premium', 'designer'],
-        }
-
-        for tag, keywords in style_mappings.items():
-            if any(kw in text for kw in keywords):
-                style_tags.append(tag)
-
+        for bucket, label in _KEYWORD_MATCHER.find(text):
+            if bucket == 'materials':
+                materials.append(label)
+            else:
+                style_tags.append(label)
+
+        if 'material' in schema_fields:
+            schema_materials = [
+                label for bucket, label in _KEYWORD_MATCHER.find(schema_fields['material'])
+                if bucket == 'materials'
+            ]
+            if schema_materials:
+                materials = schema_materials
+
+        # Keyword matches are already unique; colors can repeat in the text
         return {
             'fit': fit,
-            'colors': list(set(colors)),
-            'materials': list(set(materials)),
-            'style_tags': list(set(style_tags)),
+            'colors': list(dict.fromkeys(colors)),
+            'materials': materials,
+            'style_tags': style_tags,
         }
 
     def _extract_product_details(self, soup: BeautifulSoup) -> dict:
@@ -319,7 +535,10 @@ class EndClothingScraper(BaseScraper):
         }
 
         # Look for composition/materials info
-        comp_elem = soup.select_one('[data-test-id="composition"], .composition, [class*="composition"]')
+        comp_elem = (
+            soup.find(attrs={'data-test-id': 'composition'})
+            or soup.find(class_=_COMPOSITION_CLASS_RE)
+        )
         if comp_elem:
             comp_text = comp_elem.get_text().lower()
             if 'cotton' in comp_text:
@@ -339,21 +558,30 @@ class EndClothingScraper(BaseScraper):
             url: Category URL or 'all' to scrape all categories
         """
         if url == 'all':
-            for category in self.CATEGORIES.keys():
-                for product in self.scrape_category(category):
-                    yield product
+            # Categories are independent, so crawl them side by side
+            yield from iterate_concurrently(
+                (self.scrape_category(category) for category in self.CATEGORIES),
+                max_workers=3,
+            )
         else:
-            # Determine category from URL
-            category = 'other'
-            for cat, path in self.CATEGORIES.items():
-                if path in url:
-                    category = cat
-                    break
+            category = self._infer_category_from_url(url)
+            yield from self._scrape_details(self.scrape_category_listing(category), category)
 
-            for product_info in self.scrape_category_listing(category):
-                item = self.scrape_product_detail(product_info)
-                if item:
-                    yield item
+    def _infer_category_from_url(self, url: str) -> str:
+        """
+        Infer the CATEGORIES key for a category URL.
+
+        The query string, trailing slash and locale segment are ignored, and
+        sub-paths (e.g. a filtered or nested listing) resolve to the nearest
+        category path above them. Anything else maps to 'other'.
+        """
+        parts = urlparse(url).path.lower().strip('/').split('/')[1:]
+        while parts:
+            category = self._PATH_TO_CATEGORY.get('/'.join(parts))
+            if category:
+                return category
+            parts.pop()
+        return 'other'
 
     def scrape_category(self, category: str, max_pages: int = 20, max_products: int = 500) -> Generator[ClothingItem, None, None]:
         """
@@ -364,16 +592,70 @@ class EndClothingScraper(BaseScraper):
             max_pages: Max pages to scrape
             max_products: Max products to return
         """
+        yield from self._scrape_details(
+            self.scrape_category_listing(category, max_pages), category, max_products,
+        )
+
+    def _scrape_details(
+        self,
+        listings: Iterator[dict],
+        category: str,
+        max_products: Optional[int] = None,
+    ) -> Generator[ClothingItem, None, None]:
+        """
+        Fetch product detail pages for listing entries, several at a time.
+
+        A bounded window of detail fetches runs on a thread pool so their
+        network waits overlap; items are yielded in listing order.
+
+        Args:
+            listings: Product info dicts from scrape_category_listing
+            category: Category key, for logging
+            max_products: Max products to return, or None for no limit
+        """
         count = 0
-        for product_info in self.scrape_category_listing(category, max_pages):
-            if count >= max_products:
-                break
+        pending = deque()
+        listings_done = False
+        window = self.DETAIL_WORKERS * 2
+        done_urls = set(self._progress.get(category, {}).get('urls', ()))
 
-            item = self.scrape_product_detail(product_info)
-            if item:
-                yield item
-                count += 1
-                logger.info(f"Scraped {count} products from {category}")
+        with ThreadPoolExecutor(max_workers=self.DETAIL_WORKERS) as executor:
+            try:
+                while max_products is None or count < max_products:
+                    # Keep the window of in-flight detail fetches full
+                    while len(pending) < window:
+                        product_info = next(listings, None)
+                        if product_info is None:
+                            listings_done = True
+                            break
+                        if product_info['url'] in done_urls:
+                            continue
+                        future = executor.submit(self.scrape_product_detail, product_info)
+                        pending.append((product_info, future))
+
+                    if not pending:
+                        break
+
+                    product_info, future = pending.popleft()
+                    item = future.result()
+                    # Failed products aren't marked done so a resume retries them
+                    self._record_progress(category, product_info['page'], product_info['url'], item is not None)
+                    if item:
+                        yield item
+                        count += 1
+                        logger.info(f"Scraped {count} products from {category}")
+
+                # Every listing entry was consumed, so the category is finished
+                if listings_done and not pending:
+                    self._clear_progress(category)
+            finally:
+                # Don't start fetches nobody will read
+                for _, future in pending:
+                    future.cancel()
+                if self.checkpoint_path:
+                    with self._progress_lock:
+                        if self._unsaved_progress:
+                            self._save_progress()
 
     def scrape_brand_info(self, brand_name: str) -> Optional[Brand]:
         """
@@ -389,7 +671,7 @@ class EndClothingScraper(BaseScraper):
 
         try:
             # Extract brand description
-            desc_elem = soup.select_one('.brand-description, [class*="brand-description"]')
+            desc_elem = soup.find(class_=_BRAND_DESCRIPTION_CLASS_RE)
             description = desc_elem.get_text(strip=True) if desc_elem else ""
 
             # Extract brand origin
@@ -401,7 +683,7 @@ class EndClothingScraper(BaseScraper):
             # etc.
 
             return Brand(
-                id=str(uuid.uuid4()),
+                id=_url_id(url),
                 name=brand_name,
                 description=description,
                 aesthetics=[],  # Would need more parsing
@@ -424,7 +706,7 @@ class EndClothingScraper(BaseScraper):
             return list(self.discovered_brands)
 
         brands = []
-        brand_links = soup.select('.brand-list a, [class*="brand"] a')
+        brand_links = _BRAND_LINK_SELECTOR.select(soup)
         for link in brand_links:
             brand_name = link.get_text(strip=True)
             if brand_name:
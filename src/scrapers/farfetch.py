@@ -10,17 +10,83 @@ IMPORTANT:
 """
 import json
 import re
+import sys
 import time
 import uuid
-from typing import Generator, Optional, List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Generator, Optional, List, Dict
+from urllib.parse import urlparse
 from bs4 import BeautifulSoup
+import soupsieve
 import logging
 
-from .base import BaseScraper
+from .base import BaseScraper, class_strainer, iterate_concurrently, json_loads
+from .keywords import KeywordMatcher
 from ..models.clothing import ClothingItem, Brand
 
 logger = logging.getLogger(__name__)
 
+# Patterns used on every page and product card, compiled once at import
+_PRICE_RE = re.compile(r'\$(\d+(?:,\d{3})*(?:\.\d{2})?)')
+# The Next.js payload is matched on the raw response bytes, so pages that
+# carry it never need a DOM at all
+_NEXT_DATA_RE = re.compile(rb'<script[^>]*id="__NEXT_DATA__"[^>]*>(.+?)</script>', re.DOTALL)
+
+# Product card selectors, compiled once instead of re-parsed for every card
+_CARD_SELECTOR = soupsieve.compile('[data-testid="productCard"], [class*="ProductCard"], .product-card')
+_DESIGNER_SELECTOR = soupsieve.compile('[data-testid="productDesigner"], [class*="Designer"]')
+_DESCRIPTION_SELECTOR = soupsieve.compile('[data-testid="productDescription"], [class*="Description"]')
+_PRICE_SELECTOR = soupsieve.compile('[data-testid="price"], [class*="Price"]')
+
+# Designer pages are only read for their description block, so only that
+# element is built into the tree. Matches the 'designer-description' class
+# or any class containing 'DesignerDescription'.
+_DESIGNER_DESCRIPTION_CLASS_RE = re.compile(r'^designer-description$|DesignerDescription')
+_DESIGNER_DESCRIPTION_STRAINER = class_strainer(_DESIGNER_DESCRIPTION_CLASS_RE.search)
+
+# Style attribute vocabularies by bucket. Fit labels are checked in
+# priority order.
+_STYLE_VOCABULARY = {
+    'fit': {
+        'slim': ['slim'],
+        'oversized': ['oversized', 'oversize'],
+        'relaxed': ['relaxed'],
+        'tapered': ['tapered'],
+        'straight': ['straight'],
+        'wide': ['wide'],
+    },
+    'colors': {
+        color: [color]
+        for color in ['black', 'white', 'navy', 'blue', 'grey', 'gray', 'brown', 'green', 'red', 'beige', 'cream']
+    },
+    'materials': {
+        mat: [mat]
+        for mat in ['cotton', 'wool', 'silk', 'cashmere', 'leather', 'suede', 'linen', 'denim', 'polyester', 'nylon']
+    },
+    'style_tags': {
+        'luxury': ['luxury', 'designer', 'premium'],
+        'minimalist': ['minimal', 'clean', 'simple'],
+        'italian': ['italian', 'italy'],
+    },
+}
+
+# All buckets share one matcher so a product's text is scanned once
+_STYLE_MATCHER = KeywordMatcher({
+    (bucket, label): keywords
+    for bucket, labels in _STYLE_VOCABULARY.items()
+    for label, keywords in labels.items()
+})
+
+
+def _named(value, default: str):
+    """
+    Read a Next.js field sent either as a plain value or as a nested
+    {'name': ...} object, as brand and category are.
+    """
+    if isinstance(value, dict):
+        return value.get('name', default)
+    return default if value is None else value
+
 
 class FarfetchScraper(BaseScraper):
     """
@@ -44,6 +110,11 @@ class FarfetchScraper(BaseScraper):
         'footwear': '/us/shopping/men/shoes/items.aspx',
         'accessories': '/us/shopping/men/accessories/items.aspx',
     }
+    _PATH_TO_CATEGORY = {path: cat for cat, path in CATEGORIES.items()}
+
+    # Listing products scrape_category buffers ahead of its caller, about
+    # one results page
+    LISTING_BUFFER = 96
 
     def __init__(self, **kwargs):
         super().__init__(delay_seconds=3.0, **kwargs)  # Slower rate for Farfetch
@@ -52,7 +123,7 @@ class FarfetchScraper(BaseScraper):
             'Accept-Language': 'en-US,en;q=0.9',
             'Cache-Control': 'no-cache',
         })
-        self.discovered_brands = set()
+        self.discovered_brands: set[str] = set()
 
     def get_category_url(self, category: str, page: int = 1) -> str:
         """Build URL for category listing with pagination."""
@@ -61,61 +132,105 @@ class FarfetchScraper(BaseScraper):
             return f"{self.BASE_URL}{base_path}?page={page}"
         return f"{self.BASE_URL}{base_path}"
 
-    def scrape_category_listing(self, category: str, max_pages: int = 30) -> Generator[dict, None, None]:
+    def scrape_category_listing(
+        self,
+        category: str,
+        max_pages: int = 30,
+        max_products: Optional[int] = None,
+        convert: Optional[Callable[[dict], Any]] = None,
+    ) -> Generator:
         """
         Scrape product listings from a category page.
 
         Farfetch pages load products via JavaScript, but initial page load
         contains some products in the HTML.
+
+        Args:
+            category: Category key from CATEGORIES
+            max_pages: Maximum number of pages to scrape
+            max_products: Max listings to return, or None for no limit
+            convert: Optional function applied to each listing; its results
+                are yielded instead, and listings it returns None for are
+                skipped without counting toward max_products
         """
         page = 1
+        count = 0
         consecutive_empty = 0
 
-        while page <= max_pages:
-            url = self.get_category_url(category, page)
-            logger.info(f"Scraping Farfetch {category} page {page}")
-
-            soup = self.fetch_page(url)
-            if not soup:
-                consecutive_empty += 1
-                if consecutive_empty >= 3:
-                    break
-                page += 1
-                continue
-
-            # Farfetch embeds product data in script tags
-            products = self._extract_products_from_page(soup)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = executor.submit(self.fetch_html, self.get_category_url(category, page))
 
-            if not products:
-                consecutive_empty += 1
-                if consecutive_empty >= 2:
-                    logger.info(f"No more products for {category}")
-                    break
-                page += 1
-                continue
-
-            consecutive_empty = 0
+            while pending is not None:
+                logger.info(f"Scraping Farfetch {category} page {page}")
+                html = pending.result()
+                pending = None
 
-            for product in products:
-                self.discovered_brands.add(product.get('brand', 'Unknown'))
-                yield product
+                # Farfetch embeds product data in script tags
+                products = self._extract_products_from_page(html) if html else []
 
-            page += 1
-            time.sleep(1.5)  # Extra delay between pages
+                if products:
+                    consecutive_empty = 0
+                else:
+                    # Failed fetches are tolerated once more than empty pages
+                    consecutive_empty += 1
+                    if consecutive_empty >= (2 if html else 3):
+                        if html:
+                            logger.info(f"No more products for {category}")
+                        break
 
-    def _extract_products_from_page(self, soup: BeautifulSoup) -> List[dict]:
+                page += 1
+                # If this page can't fill max_products on its own, fetch the
+                # next page while this page's products are consumed
+                if page <= max_pages and (max_products is None or count + len(products) < max_products):
+                    pending = executor.submit(
+                        self._fetch_next_page,
+                        self.get_category_url(category, page),
+                        1.5 if products else 0,  # Extra delay between pages
+                    )
+
+                for product in products:
+                    if max_products is not None and count >= max_products:
+                        break
+
+                    # Brand names repeat across thousands of products; interning
+                    # lets the set and every item share one copy of each
+                    product['brand'] = brand = sys.intern(str(product.get('brand', 'Unknown')))
+                    self.discovered_brands.add(brand)
+                    if convert is not None:
+                        product = convert(product)
+                        if product is None:
+                            continue
+                    yield product
+                    count += 1
+
+                # Skipped listings can leave max_products unfilled after all,
+                # in which case the next page is needed and wasn't prefetched
+                if (pending is None and page <= max_pages
+                        and max_products is not None and count < max_products):
+                    pending = executor.submit(
+                        self._fetch_next_page, self.get_category_url(category, page), 1.5
+                    )
+
+    def _fetch_next_page(self, page_url: str, pause: float) -> bytes | None:
+        """Fetch a follow-up listing page after pausing."""
+        time.sleep(pause)
+        return self.fetch_html(page_url)
+
+    def _extract_products_from_page(self, html: bytes) -> List[dict]:
         """
         Extract product data from Farfetch page.
 
         Farfetch often has product data in __NEXT_DATA__ or similar JSON blobs.
+        That blob is pulled straight from the raw HTML; the page is only
+        parsed with BeautifulSoup when it yields no products.
         """
         products = []
 
         # Try to find Next.js data
-        next_data = soup.find('script', id='__NEXT_DATA__')
+        next_data = _NEXT_DATA_RE.search(html)
         if next_data:
             try:
-                data = json.loads(next_data.string)
+                data = json_loads(next_data.group(1))
                 # Navigate the Next.js data structure
                 if 'props' in data:
                     products = self._parse_next_data(data['props'])
@@ -124,7 +239,7 @@ class FarfetchScraper(BaseScraper):
 
         # Fallback to HTML parsing
         if not products:
-            products = self._parse_html_products(soup)
+            products = self._parse_html_products(BeautifulSoup(html, 'lxml'))
 
         return products
 
@@ -146,14 +261,14 @@ class FarfetchScraper(BaseScraper):
         for item in listings:
             if isinstance(item, dict):
                 product = {
-                    'id': str(item.get('id', uuid.uuid4())),
-                    'brand': item.get('brand', {}).get('name', 'Unknown') if isinstance(item.get('brand'), dict) else item.get('brand', 'Unknown'),
+                    'id': str(item['id']) if 'id' in item else uuid.uuid4().hex,
+                    'brand': _named(item.get('brand'), 'Unknown'),
                     'name': item.get('shortDescription', item.get('name', 'Unknown')),
                     'url': self._build_product_url(item),
                     'price': self._extract_price(item),
                     'description': item.get('description', ''),
                     'colors': self._extract_colors(item),
-                    'category': item.get('category', {}).get('name', 'other'),
+                    'category': _named(item.get('category'), 'other'),
                 }
                 products.append(product)
 
@@ -164,7 +279,7 @@ class FarfetchScraper(BaseScraper):
         products = []
 
         # Common Farfetch product card selectors
-        product_cards = soup.select('[data-testid="productCard"], [class*="ProductCard"], .product-card')
+        product_cards = _CARD_SELECTOR.select(soup)
 
         for card in product_cards:
             try:
@@ -178,19 +293,19 @@ class FarfetchScraper(BaseScraper):
                     url = self.BASE_URL + url
 
                 # Brand
-                brand_elem = card.select_one('[data-testid="productDesigner"], [class*="Designer"]')
+                brand_elem = _DESIGNER_SELECTOR.select_one(card)
                 brand = brand_elem.get_text(strip=True) if brand_elem else "Unknown"
 
                 # Name
-                name_elem = card.select_one('[data-testid="productDescription"], [class*="Description"]')
+                name_elem = _DESCRIPTION_SELECTOR.select_one(card)
                 name = name_elem.get_text(strip=True) if name_elem else "Unknown"
 
                 # Price
-                price_elem = card.select_one('[data-testid="price"], [class*="Price"]')
+                price_elem = _PRICE_SELECTOR.select_one(card)
                 price = None
                 if price_elem:
                     price_text = price_elem.get_text(strip=True)
-                    price_match = re.search(r'\$(\d+(?:,\d{3})*(?:\.\d{2})?)', price_text)
+                    price_match = _PRICE_RE.search(price_text)
                     if price_match:
                         price = float(price_match.group(1).replace(',', ''))
 
@@ -251,9 +366,11 @@ class FarfetchScraper(BaseScraper):
         Main product scraping interface.
         """
         if url == 'all':
-            for category in self.CATEGORIES.keys():
-                for product in self.scrape_category(category):
-                    yield product
+            # Categories are independent, so crawl them side by side
+            yield from iterate_concurrently(
+                (self.scrape_category(category) for category in self.CATEGORIES),
+                max_workers=3,
+            )
         else:
             # Single category
             category = self._infer_category_from_url(url)
@@ -267,23 +384,29 @@ class FarfetchScraper(BaseScraper):
         Scrape all products in a category.
         """
         count = 0
-        for product_info in self.scrape_category_listing(category, max_pages):
-            if count >= max_products:
-                break
-
-            item = self._convert_to_clothing_item(product_info, category)
-            if item:
-                yield item
-                count += 1
-                if count % 50 == 0:
-                    logger.info(f"Scraped {count} products from Farfetch {category}")
+        # The listing crawl runs on a background thread, up to a page of
+        # products ahead, so fetching and parsing overlap with whatever
+        # the caller does with each yielded item
+        items = iterate_concurrently(
+            [self.scrape_category_listing(
+                category, max_pages, max_products,
+                convert=lambda product_info: self._convert_to_clothing_item(product_info, category),
+            )],
+            max_workers=1,
+            buffer_size=self.LISTING_BUFFER,
+        )
+        for item in items:
+            yield item
+            count += 1
+            if count % 50 == 0:
+                logger.info(f"Scraped {count} products from Farfetch {category}")
 
     def _convert_to_clothing_item(self, product_info: dict, category: str = 'other') -> Optional[ClothingItem]:
         """Convert scraped product info to ClothingItem."""
         try:
             # Parse attributes from description/name
-            text = f"{product_info.get('name', '')} {product_info.get('description', '')}"
-            attrs = self._parse_style_attributes(text)
+            text_lower = f"{product_info.get('name', '')} {product_info.get('description', '')}".lower()
+            attrs = self._parse_style_attributes(text_lower)
 
             return ClothingItem(
                 id=str(product_info.get('id', uuid.uuid4())),
@@ -303,61 +426,23 @@ class FarfetchScraper(BaseScraper):
             logger.debug(f"Error converting product: {e}")
             return None
 
-    def _parse_style_attributes(self, text: str) -> dict:
-        """Parse style attributes from text."""
-        text_lower = text.lower()
-
-        # Fit
-        fit = None
-        if 'slim' in text_lower:
-            fit = 'slim'
-        elif 'oversized' in text_lower or 'oversize' in text_lower:
-            fit = 'oversized'
-        elif 'relaxed' in text_lower:
-            fit = 'relaxed'
-        elif 'tapered' in text_lower:
-            fit = 'tapered'
-        elif 'straight' in text_lower:
-            fit = 'straight'
-        elif 'wide' in text_lower:
-            fit = 'wide'
-
-        # Colors
-        colors = []
-        color_words = ['black', 'white', 'navy', 'blue', 'grey', 'gray', 'brown', 'green', 'red', 'beige', 'cream']
-        for color in color_words:
-            if color in text_lower:
-                colors.append(color)
-
-        # Materials
-        materials = []
-        material_words = ['cotton', 'wool', 'silk', 'cashmere', 'leather', 'suede', 'linen', 'denim', 'polyester', 'nylon']
-        for mat in material_words:
-            if mat in text_lower:
-                materials.append(mat)
-
-        # Style tags
-        style_tags = []
-        if any(word in text_lower for word in ['luxury', 'designer', 'premium']):
-            style_tags.append('luxury')
-        if any(word in text_lower for word in ['minimal', 'clean', 'simple']):
-            style_tags.append('minimalist')
-        if any(word in text_lower for word in ['italian', 'italy']):
-            style_tags.append('italian')
+    def _parse_style_attributes(self, text_lower: str) -> dict:
+        """Parse style attributes from already-lowercased text."""
+        hits = {bucket: [] for bucket in _STYLE_VOCABULARY}
+        for bucket, label in _STYLE_MATCHER.find(text_lower):
+            hits[bucket].append(label)
 
         return {
-            'fit': fit,
-            'colors': colors,
-            'materials': materials,
-            'style_tags': style_tags,
+            'fit': hits['fit'][0] if hits['fit'] else None,
+            'colors': hits['colors'],
+            'materials': hits['materials'],
+            'style_tags': hits['style_tags'],
         }
 
     def _infer_category_from_url(self, url: str) -> str:
         """Infer category from URL."""
-        for cat, path in self.CATEGORIES.items():
-            if path in url:
-                return cat
-        return 'other'
+        # An exact lookup on the path, ignoring the query string (?page=N)
+        return self._PATH_TO_CATEGORY.get(urlparse(url).path, 'other')
 
     def scrape_brand_info(self, brand_name: str) -> Optional[Brand]:
         """Scrape brand information from Farfetch."""
@@ -365,12 +450,12 @@ class FarfetchScraper(BaseScraper):
         brand_slug = brand_name.lower().replace(' ', '-').replace("'", '')
         url = f"{self.BASE_URL}/us/designers/{brand_slug}"
 
-        soup = self.fetch_page(url)
+        soup = self.fetch_page(url, parse_only=_DESIGNER_DESCRIPTION_STRAINER)
         if not soup:
             return None
 
         try:
-            desc_elem = soup.select_one('.designer-description, [class*="DesignerDescription"]')
+            desc_elem = soup.find(class_=_DESIGNER_DESCRIPTION_CLASS_RE)
             description = desc_elem.get_text(strip=True) if desc_elem else ""
 
             return Brand(
@@ -0,0 +1,76 @@
+"""
+Single-pass keyword matching for scraped text.
+
+Scrapers tag items by testing a vocabulary of words against a lowered title
+or description. KeywordMatcher compiles a vocabulary into one regex
+alternation so the text is scanned once instead of once per keyword, while
+keeping the substring semantics of the original ``keyword in text`` checks.
+"""
+import re
+import sys
+from typing import Hashable, Iterable, Mapping, Optional
+
+
+def _intern(label: Hashable) -> Hashable:
+    return sys.intern(label) if isinstance(label, str) else label
+
+
+class KeywordMatcher:
+    """
+    Match a fixed vocabulary against text in a single scan.
+
+    The vocabulary is either an iterable of keywords (each keyword is its own
+    label) or a mapping of label -> keywords. Labels can be any hashable,
+    e.g. (bucket, value) tuples when several vocabularies share one scan.
+    Labels are returned in declaration order, so callers that relied on dict
+    order for priority keep the same result.
+    """
+
+    def __init__(self, vocabulary: Iterable[str] | Mapping[Hashable, Iterable[str]]):
+        if isinstance(vocabulary, Mapping):
+            pairs = [(label, kw) for label, keywords in vocabulary.items() for kw in keywords]
+        else:
+            pairs = [(kw, kw) for kw in vocabulary]
+
+        pairs = [(_intern(label), kw) for label, kw in pairs]
+        self.labels = tuple(dict.fromkeys(label for label, _ in pairs))
+
+        keyword_labels: dict[str, set] = {}
+        for label, kw in pairs:
+            keyword_labels.setdefault(kw, set()).add(label)
+
+        # The scan reports only the longest keyword starting at each position,
+        # so a hit also implies every shorter keyword that is a prefix of it
+        # ('denim pants' implies 'denim').
+        self._implied = {
+            kw: frozenset().union(*(
+                labels for other, labels in keyword_labels.items() if kw.startswith(other)
+            ))
+            for kw in keyword_labels
+        }
+
+        # Zero-width lookahead lets overlapping keywords match at every offset
+        alternation = '|'.join(re.escape(kw) for kw in sorted(keyword_labels, key=len, reverse=True))
+        self._pattern = re.compile(f'(?=({alternation}))')
+
+    def find(self, text: str) -> list:
+        """
+        Return the labels whose keywords occur in text.
+
+        Args:
+            text: Text to scan (callers pass it already lowercased)
+
+        Returns:
+            Matching labels in declaration order
+        """
+        hits = set()
+        for match in self._pattern.finditer(text):
+            hits |= self._implied[match.group(1)]
+        if not hits:
+            return []
+        return [label for label in self.labels if label in hits]
+
+    def first(self, text: str, default: Optional[Hashable] = None) -> Optional[Hashable]:
+        """Return the highest-priority matching label, or default if none match."""
+        labels = self.find(text)
+        return labels[0] if labels else default
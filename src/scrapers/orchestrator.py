@@ -9,15 +9,16 @@ It handles:
 - Gap filling with eBay fallback
 - Progress tracking
 """
-import json
 import os
 import time
 import logging
-from typing import List, Dict, Set, Optional
+from collections import Counter, defaultdict
+from typing import Callable, Generator, Iterable, List, Dict, Set, Optional
 from pathlib import Path
 from datetime import datetime
 
 from ..models.clothing import ClothingItem, Brand, StyleDiscussion
+from .base import iterate_concurrently, json_dumps, json_loads
 from .end_clothing import EndClothingScraper
 from .farfetch import FarfetchScraper
 from .styleforum import StyleForumScraper
@@ -26,6 +27,31 @@ from .ebay import EbayScraper
 logger = logging.getLogger(__name__)
 
 
+def _write_json_records(path: Path, records: Iterable):
+    """
+    Write records as an indented JSON array, one record at a time.
+
+    Produces the same bytes as json_dumps([r.to_dict() for r in records],
+    indent=True), without holding every record's dict and the whole encoded
+    array in memory at once. Like json_dumps, non-ASCII text is written as
+    raw UTF-8 rather than \\uXXXX escapes, so readers must open the file as
+    UTF-8.
+
+    Args:
+        path: File to write
+        records: Objects with a to_dict() method
+    """
+    with open(path, 'wb', buffering=1 << 20) as f:
+        separator = b'[\n'
+        for record in records:
+            # Nest the record one level deep. Encoded JSON strings never
+            # contain raw newlines, so every newline is between tokens.
+            encoded = json_dumps(record.to_dict(), indent=True)
+            f.write(separator + b'  ' + encoded.replace(b'\n', b'\n  '))
+            separator = b',\n'
+        f.write(b'[]' if separator == b'[\n' else b'\n]')
+
+
 class DataPipelineOrchestrator:
     """
     Main orchestrator for building production-level dataset.
@@ -33,6 +59,12 @@ class DataPipelineOrchestrator:
     Coordinates scraping from multiple sources and consolidates data.
     """
 
+    # Collections checkpointed to append-only JSONL logs
+    _CHECKPOINT_LOGS = ('items', 'brands', 'discussions')
+
+    # Sections of one source (categories, forums) crawled at once
+    SECTION_WORKERS = 3
+
     def __init__(
         self,
         output_dir: str = "./data/production",
@@ -57,7 +89,11 @@ class DataPipelineOrchestrator:
 
         # Tracking
         self.discovered_brands: Set[str] = set()
-        self.item_hashes: Set[str] = set()  # For deduplication
+        # Indexes kept up to date by add_item/add_brand, so brand lookups
+        # never rescan the full item or brand lists
+        self._items_by_brand: Dict[str, List[ClothingItem]] = defaultdict(list)
+        self._brand_names: Set[str] = set()
+        self.item_hashes: Set[int] = set()  # For deduplication
         self.stats = {
             'items_scraped': 0,
             'brands_discovered': 0,
@@ -66,52 +102,165 @@ class DataPipelineOrchestrator:
             'errors': [],
         }
 
+        # Records of each collection already written to its checkpoint log
+        self._flushed = {name: 0 for name in self._CHECKPOINT_LOGS}
+
         # Load existing checkpoint if available
         self._load_checkpoint()
 
-    def _item_hash(self, item: ClothingItem) -> str:
-        """Generate hash for deduplication."""
-        return f"{item.brand}|{item.name}|{item.category}".lower()
+    def _item_hash(self, item: ClothingItem) -> int:
+        """
+        Generate hash for deduplication.
 
-    def _load_checkpoint(self):
-        """Load existing data from checkpoint."""
-        checkpoint_file = self.output_dir / "checkpoint.json"
-        if checkpoint_file.exists():
+        Only the integer hash of the normalized key is kept, not the key
+        string itself. Hashes are rebuilt on every load, so per-process hash
+        randomization doesn't matter, and a 64-bit collision between two
+        distinct items is vanishingly unlikely at catalog sizes.
+        """
+        return hash(f"{item.brand}|{item.name}|{item.category}".lower())
+
+    def _checkpoint_log(self, name: str) -> Path:
+        """Path of the append-only checkpoint log for one collection."""
+        return self.output_dir / f"checkpoint_{name}.jsonl"
+
+    def _read_checkpoint_log(self, name: str) -> List[dict]:
+        """
+        Read the records of one checkpoint log.
+
+        A save interrupted mid-write can leave a partial last line, and a
+        damaged file can hold other unreadable lines. They are dropped and
+        the log rewritten without them, so the good records are kept and
+        later appends don't sit behind lines every load would trip on.
+        """
+        log_file = self._checkpoint_log(name)
+        if not log_file.exists():
+            return []
+
+        records = []
+        good_lines = []
+        dropped = 0
+        for line in log_file.read_bytes().splitlines():
+            if not line:
+                continue
             try:
-                with open(checkpoint_file, 'r') as f:
-                    data = json.load(f)
+                records.append(json_loads(line))
+            except ValueError:
+                dropped += 1
+                continue
+            good_lines.append(line)
+
+        if dropped:
+            logger.warning(f"Dropping {dropped} unreadable records from {log_file.name}")
+            tmp_file = log_file.with_suffix('.tmp')
+            tmp_file.write_bytes(b''.join(line + b'\n' for line in good_lines))
+            os.replace(tmp_file, log_file)
+
+        return records
+
+    def _set_aside_checkpoint(self, files: List[Path]):
+        """
+        Rename checkpoint files that couldn't be loaded.
+
+        Later saves then start fresh logs instead of appending to files every
+        resume would fail on, and the originals are kept for inspection.
+        """
+        suffix = f".corrupt-{datetime.now():%Y%m%d%H%M%S}"
+        for path in files:
+            if path.exists():
+                path.rename(path.with_name(path.name + suffix))
+                logger.warning(f"Moved unloadable checkpoint file {path.name} aside")
+
+    def _load_checkpoint(self):
+        """
+        Load existing data from checkpoint.
 
+        Everything is read into locals first and only assigned once every
+        file has loaded. Unreadable log lines are dropped by
+        _read_checkpoint_log; if loading still fails, the checkpoint files
+        are moved aside and the orchestrator starts empty rather than
+        half-loaded with stale flush counts and indexes.
+        """
+        stats_file = self.output_dir / "checkpoint_stats.json"
+        legacy_file = self.output_dir / "checkpoint.json"
+        try:
+            if stats_file.exists() or any(self._checkpoint_log(name).exists() for name in self._CHECKPOINT_LOGS):
                 logger.info("Loading checkpoint...")
-                self.items = [ClothingItem.from_dict(d) for d in data.get('items', [])]
-                self.brands = [Brand.from_dict(d) for d in data.get('brands', [])]
-                self.discussions = [StyleDiscussion.from_dict(d) for d in data.get('discussions', [])]
-                self.stats = data.get('stats', self.stats)
+                items = [ClothingItem.from_dict(d) for d in self._read_checkpoint_log('items')]
+                brands = [Brand.from_dict(d) for d in self._read_checkpoint_log('brands')]
+                discussions = [StyleDiscussion.from_dict(d) for d in self._read_checkpoint_log('discussions')]
+                stats = self.stats
+                if stats_file.exists():
+                    stats = json_loads(stats_file.read_bytes()).get('stats', stats)
+
+                # Everything loaded is already in the logs
+                flushed = {'items': len(items), 'brands': len(brands), 'discussions': len(discussions)}
+
+            elif legacy_file.exists():
+                # Single-file checkpoint from older versions. Nothing is marked
+                # flushed, so the first save copies it all into the logs.
+                logger.info("Loading checkpoint...")
+                data = json_loads(legacy_file.read_bytes())
+                items = [ClothingItem.from_dict(d) for d in data.get('items', [])]
+                brands = [Brand.from_dict(d) for d in data.get('brands', [])]
+                discussions = [StyleDiscussion.from_dict(d) for d in data.get('discussions', [])]
+                stats = data.get('stats', self.stats)
+                flushed = {name: 0 for name in self._CHECKPOINT_LOGS}
 
-                # Rebuild hashes
-                for item in self.items:
-                    self.item_hashes.add(self._item_hash(item))
-                for brand in self.brands:
-                    self.discovered_brands.add(brand.name)
+            else:
+                return
 
-                logger.info(f"Loaded {len(self.items)} items, {len(self.brands)} brands, {len(self.discussions)} discussions")
+        except Exception as e:
+            logger.error(f"Error loading checkpoint: {e}")
+            self._set_aside_checkpoint(
+                [self._checkpoint_log(name) for name in self._CHECKPOINT_LOGS] + [stats_file, legacy_file]
+            )
+            return
 
-            except Exception as e:
-                logger.error(f"Error loading checkpoint: {e}")
+        self.items = items
+        self.brands = brands
+        self.discussions = discussions
+        self.stats = stats
+        self._flushed = flushed
+
+        # Rebuild hashes and indexes
+        for item in self.items:
+            self.item_hashes.add(self._item_hash(item))
+            self._items_by_brand[item.brand].append(item)
+        for brand in self.brands:
+            self.discovered_brands.add(brand.name)
+            self._brand_names.add(brand.name)
+
+        logger.info(f"Loaded {len(self.items)} items, {len(self.brands)} brands, {len(self.discussions)} discussions")
 
     def _save_checkpoint(self):
-        """Save current state to checkpoint."""
-        checkpoint_file = self.output_dir / "checkpoint.json"
+        """
+        Save current state to checkpoint.
+
+        Items, brands and discussions are only ever appended, so each save
+        appends the records added since the previous save to that
+        collection's JSONL log instead of rewriting everything collected.
+        Only the small stats file is rewritten.
+        """
+        stats_file = self.output_dir / "checkpoint_stats.json"
         try:
+            for name in self._CHECKPOINT_LOGS:
+                records = getattr(self, name)
+                new_records = records[self._flushed[name]:]
+                if not new_records:
+                    continue
+
+                with open(self._checkpoint_log(name), 'ab') as f:
+                    f.write(b''.join(json_dumps(record.to_dict()) + b'\n' for record in new_records))
+                self._flushed[name] = len(records)
+
             data = {
-                'items': [item.to_dict() for item in self.items],
-                'brands': [brand.to_dict() for brand in self.brands],
-                'discussions': [disc.to_dict() for disc in self.discussions],
                 'stats': self.stats,
                 'timestamp': datetime.now().isoformat(),
             }
-
-            with open(checkpoint_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            # Replace atomically so an interrupted save keeps the old stats
+            tmp_file = stats_file.with_suffix('.tmp')
+            tmp_file.write_bytes(json_dumps(data, indent=True))
+            os.replace(tmp_file, stats_file)
 
             logger.info(f"Checkpoint saved: {len(self.items)} items, {len(self.brands)} brands")
 
@@ -132,6 +281,7 @@ class DataPipelineOrchestrator:
         self.items.append(item)
         self.item_hashes.add(item_hash)
         self.discovered_brands.add(item.brand)
+        self._items_by_brand[item.brand].append(item)
         self.stats['items_scraped'] += 1
 
         # Update source stats
@@ -145,11 +295,12 @@ class DataPipelineOrchestrator:
         return True
 
     def add_brand(self, brand: Brand) -> bool:
-        """Add brand if not duplicate."""
-        if brand.name in self.discovered_brands:
+        """Add brand if no profile with the same name exists yet."""
+        if brand.name in self._brand_names:
             return False
 
         self.brands.append(brand)
+        self._brand_names.add(brand.name)
         self.discovered_brands.add(brand.name)
         self.stats['brands_discovered'] += 1
         return True
@@ -160,15 +311,48 @@ class DataPipelineOrchestrator:
         self.stats['discussions_collected'] += 1
 
         # Extract and track mentioned brands
-        for brand in discussion.mentioned_brands:
-            self.discovered_brands.add(brand)
+        self.discovered_brands.update(discussion.mentioned_brands)
 
         return True
 
+    def _scrape_sections(
+        self,
+        source: str,
+        sections: List[str],
+        scrape: Callable[[str], Iterable],
+    ) -> Generator[tuple, None, None]:
+        """
+        Crawl several sections (categories, forums) of one source concurrently.
+
+        Sections are drained on worker threads so their network waits
+        overlap. Records come back to the calling thread, so add_item and
+        add_discussion stay single-threaded. A section that fails is logged
+        and recorded in stats without stopping the others.
+
+        Args:
+            source: Source name used in log and error messages
+            sections: Sections to crawl
+            scrape: Returns the records of one section
+
+        Yields:
+            (section, record) pairs
+        """
+        def run(section: str):
+            logger.info(f"Scraping {source}: {section}")
+            try:
+                for record in scrape(section):
+                    yield section, record
+            except Exception as e:
+                logger.error(f"Error scraping {source} {section}: {e}")
+                self.stats['errors'].append(f"{source}/{section}: {str(e)}")
+
+        return iterate_concurrently((run(section) for section in sections), max_workers=self.SECTION_WORKERS)
+
     def scrape_end_clothing(
         self,
         categories: Optional[List[str]] = None,
         max_per_category: int = 200,
+        resume: bool = False,
     ):
         """
         Scrape End Clothing catalog.
@@ -176,26 +360,32 @@ class DataPipelineOrchestrator:
         Args:
             categories: List of categories to scrape (None = all)
             max_per_category: Max items per category
+            resume: Continue an interrupted crawl from its checkpoint instead
+                of starting every category from page 1
         """
         logger.info("=== Starting End Clothing scrape ===")
-        scraper = EndClothingScraper()
+        scraper = EndClothingScraper(
+            checkpoint_path=str(self.output_dir / "end_crawl_checkpoint.json"),
+            resume=resume,
+        )
 
         if categories is None:
             categories = list(scraper.CATEGORIES.keys())
 
+        counts = Counter()
+        results = self._scrape_sections(
+            'End',
+            categories,
+            lambda category: scraper.scrape_category(category, max_products=max_per_category),
+        )
+        for category, item in results:
+            if self.add_item(item):
+                counts[category] += 1
+                if counts[category] % 25 == 0:
+                    logger.info(f"End {category}: {counts[category]} items")
+
         for category in categories:
-            logger.info(f"Scraping End: {category}")
-            try:
-                count = 0
-                for item in scraper.scrape_category(category, max_products=max_per_category):
-                    if self.add_item(item):
-                        count += 1
-                        if count % 25 == 0:
-                            logger.info(f"End {category}: {count} items")
-                logger.info(f"End {category}: Total {count} new items")
-            except Exception as e:
-                logger.error(f"Error scraping End {category}: {e}")
-                self.stats['errors'].append(f"End/{category}: {str(e)}")
+            logger.info(f"End {category}: Total {counts[category]} new items")
 
         self._save_checkpoint()
 
@@ -217,19 +407,20 @@ class DataPipelineOrchestrator:
         if categories is None:
             categories = list(scraper.CATEGORIES.keys())
 
+        counts = Counter()
+        results = self._scrape_sections(
+            'Farfetch',
+            categories,
+            lambda category: scraper.scrape_category(category, max_products=max_per_category),
+        )
+        for category, item in results:
+            if self.add_item(item):
+                counts[category] += 1
+                if counts[category] % 25 == 0:
+                    logger.info(f"Farfetch {category}: {counts[category]} items")
+
         for category in categories:
-            logger.info(f"Scraping Farfetch: {category}")
-            try:
-                count = 0
-                for item in scraper.scrape_category(category, max_products=max_per_category):
-                    if self.add_item(item):
-                        count += 1
-                        if count % 25 == 0:
-                            logger.info(f"Farfetch {category}: {count} items")
-                logger.info(f"Farfetch {category}: Total {count} new items")
-            except Exception as e:
-                logger.error(f"Error scraping Farfetch {category}: {e}")
-                self.stats['errors'].append(f"Farfetch/{category}: {str(e)}")
+            logger.info(f"Farfetch {category}: Total {counts[category]} new items")
 
         self._save_checkpoint()
 
@@ -298,25 +489,20 @@ class DataPipelineOrchestrator:
         if forums is None:
             forums = list(scraper.FORUMS.keys())
 
-        for forum in forums:
-            logger.info(f"Scraping StyleForum: {forum}")
-            try:
-                count = 0
-                thread_count = 0
-                for thread_info in scraper.scrape_forum_threads(forum, max_pages=5):
-                    if thread_count >= threads_per_forum:
-                        break
-
-                    discussion = scraper.scrape_thread(thread_info)
-                    if discussion and self.add_discussion(discussion):
-                        count += 1
-                    thread_count += 1
+        def forum_discussions(forum: str) -> Generator[StyleDiscussion, None, None]:
+            threads = scraper.scrape_forum_threads(forum, max_pages=5, max_threads=threads_per_forum)
+            for thread_info in threads:
+                discussion = scraper.scrape_thread(thread_info)
+                if discussion:
+                    yield discussion
 
-                logger.info(f"StyleForum {forum}: {count} discussions")
+        counts = Counter()
+        for forum, discussion in self._scrape_sections('StyleForum', forums, forum_discussions):
+            if self.add_discussion(discussion):
+                counts[forum] += 1
 
-            except Exception as e:
-                logger.error(f"Error scraping StyleForum {forum}: {e}")
-                self.stats['errors'].append(f"StyleForum/{forum}: {str(e)}")
+        for forum in forums:
+            logger.info(f"StyleForum {forum}: {counts[forum]} discussions")
 
         self._save_checkpoint()
 
@@ -338,14 +524,9 @@ class DataPipelineOrchestrator:
         if brand_list is None:
             brand_list = list(self.discovered_brands)
 
-        # Count items per brand
-        brand_counts = {}
-        for item in self.items:
-            brand_counts[item.brand] = brand_counts.get(item.brand, 0) + 1
-
         # Find underrepresented brands
         for brand in brand_list:
-            current = brand_counts.get(brand, 0)
+            current = len(self._items_by_brand.get(brand, ()))
             if current < min_items_per_brand:
                 needed = min_items_per_brand - current
                 logger.info(f"eBay: Searching {brand} (have {current}, need {needed})")
@@ -366,16 +547,9 @@ class DataPipelineOrchestrator:
         """Build brand profiles from collected items."""
         logger.info("=== Building brand profiles ===")
 
-        # Group items by brand
-        brand_items = {}
-        for item in self.items:
-            if item.brand not in brand_items:
-                brand_items[item.brand] = []
-            brand_items[item.brand].append(item)
-
-        # Create brand profiles
-        for brand_name, items in brand_items.items():
-            if brand_name in [b.name for b in self.brands]:
+        # Create brand profiles from the items add_item grouped by brand
+        for brand_name, items in self._items_by_brand.items():
+            if brand_name in self._brand_names:
                 continue
 
             # Aggregate data
@@ -479,22 +653,13 @@ class DataPipelineOrchestrator:
         logger.info("Saving production dataset...")
 
         # Save as JSON files
-        items_file = self.output_dir / "items.json"
-        with open(items_file, 'w') as f:
-            json.dump([item.to_dict() for item in self.items], f, indent=2)
-
-        brands_file = self.output_dir / "brands.json"
-        with open(brands_file, 'w') as f:
-            json.dump([brand.to_dict() for brand in self.brands], f, indent=2)
-
-        discussions_file = self.output_dir / "discussions.json"
-        with open(discussions_file, 'w') as f:
-            json.dump([disc.to_dict() for disc in self.discussions], f, indent=2)
+        _write_json_records(self.output_dir / "items.json", self.items)
+        _write_json_records(self.output_dir / "brands.json", self.brands)
+        _write_json_records(self.output_dir / "discussions.json", self.discussions)
 
         # Save stats
         stats_file = self.output_dir / "stats.json"
-        with open(stats_file, 'w') as f:
-            json.dump(self.stats, f, indent=2)
+        stats_file.write_bytes(json_dumps(self.stats, indent=True))
 
         logger.info(f"Data saved to {self.output_dir}")
         logger.info(f"  - {len(self.items)} items")
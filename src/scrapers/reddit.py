@@ -19,10 +19,78 @@ try:
 except ImportError:
     PRAW_AVAILABLE = False
 
+from .keywords import KeywordMatcher
 from ..models.clothing import StyleDiscussion, Brand
 
 logger = logging.getLogger(__name__)
 
+# Common menswear brands - expand this list
+_KNOWN_BRANDS = [
+    # Japanese
+    'Uniqlo', 'Engineered Garments', 'Orslow', 'Kapital', 'Visvim',
+    'Needles', 'Comme des Garcons', 'Yohji Yamamoto', 'Issey Miyake',
+    'Nanamica', 'And Wander', 'Snow Peak', 'Beams', 'United Arrows',
+
+    # Scandinavian
+    'Acne Studios', 'Norse Projects', 'Our Legacy', 'Arket',
+    'Filippa K', 'COS', 'Samsoe Samsoe', 'Wood Wood',
+
+    # Heritage/Workwear
+    'Carhartt', 'Carhartt WIP', 'Dickies', 'Red Wing', 'Filson',
+    'Pendleton', 'Schott', 'Levi\'s', 'Wrangler', 'Lee',
+
+    # Contemporary
+    'A.P.C.', 'Acne', 'AMI', 'Sandro', 'The Kooples',
+    'AllSaints', 'Theory', 'Vince', 'Rag & Bone',
+
+    # Streetwear
+    'Supreme', 'Stussy', 'Palace', 'Bape', 'Kith',
+    'Noah', 'Aimé Leon Dore', 'Online Ceramics',
+
+    # Premium Denim
+    'Naked & Famous', 'Japan Blue', '3sixteen', 'Rogue Territory',
+    'Iron Heart', 'The Flat Head', 'Momotaro', 'Pure Blue Japan',
+
+    # Others
+    'Patagonia', 'Arc\'teryx', 'North Face', 'Stone Island',
+    'C.P. Company', 'Barbour', 'Baracuta', 'Drake\'s',
+]
+
+# Aesthetic styles, each detected by any of its keywords
+_STYLE_PATTERNS = {
+    'minimalist': ['minimal', 'minimalist', 'clean', 'simple'],
+    'workwear': ['workwear', 'work wear', 'utility', 'chore coat'],
+    'streetwear': ['streetwear', 'street style', 'hypebeast'],
+    'heritage': ['heritage', 'classic', 'timeless', 'traditional'],
+    'techwear': ['techwear', 'technical', 'gorpcore'],
+    'japanese': ['japanese', 'japan made', 'made in japan'],
+    'scandinavian': ['scandinavian', 'nordic', 'scandi'],
+    'americana': ['americana', 'ivy style', 'prep'],
+    'military': ['military', 'mil-spec', 'field jacket'],
+    'oversized': ['oversized', 'boxy', 'loose fit'],
+    'slim': ['slim fit', 'skinny', 'tapered'],
+    'raw denim': ['raw denim', 'selvedge', 'unsanforized'],
+}
+
+# Clothing item types
+_ITEM_KEYWORDS = [
+    'jeans', 'pants', 'trousers', 'chinos',
+    'jacket', 'coat', 'blazer', 'cardigan',
+    'shirt', 'oxford', 'flannel', 't-shirt',
+    'hoodie', 'sweatshirt', 'sweater',
+    'boots', 'sneakers', 'shoes',
+    'shorts', 'overalls', 'coveralls',
+]
+
+# Fit descriptors, compiled once at import
+_FIT_RE = re.compile(r'\b(relaxed|loose|oversized|slim|tapered|straight|wide)\s+fit\b')
+_RISE_RE = re.compile(r'\b(high|mid|low)\s+rise\b')
+
+# Each vocabulary is matched against a post in a single scan
+_BRAND_MATCHER = KeywordMatcher({brand: [brand.lower()] for brand in _KNOWN_BRANDS})
+_STYLE_MATCHER = KeywordMatcher(_STYLE_PATTERNS)
+_ITEM_MATCHER = KeywordMatcher(_ITEM_KEYWORDS)
+
 
 class RedditScraper:
     """Scraper for fashion-related Reddit content."""
@@ -56,6 +124,11 @@ class RedditScraper:
         'fit check',
         'fit pics',
     ]
+    _STYLE_KEYWORD_RE = re.compile('|'.join(map(re.escape, STYLE_KEYWORDS)))
+
+    # Posts with less body text than this are only kept when they mention
+    # one of the STYLE_KEYWORDS
+    MIN_UNFILTERED_CONTENT = 200
 
     def __init__(
         self,
@@ -163,16 +236,21 @@ class RedditScraper:
             return None
 
         content = submission.selftext or ""
-        full_text = f"{submission.title} {content}"
+        # Lowered once and shared by every extractor
+        text_lower = f"{submission.title} {content}".lower()
+
+        # Skip short, off-topic posts before running the extractors
+        if len(content) < self.MIN_UNFILTERED_CONTENT and not self._STYLE_KEYWORD_RE.search(text_lower):
+            return None
 
         # Extract mentioned brands
-        brands = self._extract_brands(full_text)
+        brands = self._extract_brands(text_lower)
 
         # Extract style descriptors
-        style_descriptors = self._extract_style_descriptors(full_text)
+        style_descriptors = self._extract_style_descriptors(text_lower)
 
         # Extract mentioned items
-        items = self._extract_item_types(full_text)
+        items = self._extract_item_types(text_lower)
 
         return StyleDiscussion(
             id=str(uuid.uuid4()),
@@ -188,106 +266,26 @@ class RedditScraper:
             num_comments=submission.num_comments,
         )
 
-    def _extract_brands(self, text: str) -> list[str]:
-        """Extract brand names mentioned in text."""
-        # Common menswear brands - expand this list
-        known_brands = [
-            # Japanese
-            'Uniqlo', 'Engineered Garments', 'Orslow', 'Kapital', 'Visvim',
-            'Needles', 'Comme des Garcons', 'Yohji Yamamoto', 'Issey Miyake',
-            'Nanamica', 'And Wander', 'Snow Peak', 'Beams', 'United Arrows',
-
-            # Scandinavian
-            'Acne Studios', 'Norse Projects', 'Our Legacy', 'Arket',
-            'Filippa K', 'COS', 'Samsoe Samsoe', 'Wood Wood',
-
-            # Heritage/Workwear
-            'Carhartt', 'Carhartt WIP', 'Dickies', 'Red Wing', 'Filson',
-            'Pendleton', 'Schott', 'Levi\'s', 'Wrangler', 'Lee',
-
-            # Contemporary
-            'A.P.C.', 'Acne', 'AMI', 'Sandro', 'The Kooples',
-            'AllSaints', 'Theory', 'Vince', 'Rag & Bone',
-
-            # Streetwear
-            'Supreme', 'Stussy', 'Palace', 'Bape', 'Kith',
-            'Noah', 'Aimé Leon Dore', 'Online Ceramics',
-
-            # Premium Denim
-            'Naked & Famous', 'Japan Blue', '3sixteen', 'Rogue Territory',
-            'Iron Heart', 'The Flat Head', 'Momotaro', 'Pure Blue Japan',
-
-            # Others
-            'Patagonia', 'Arc\'teryx', 'North Face', 'Stone Island',
-            'C.P. Company', 'Barbour', 'Baracuta', 'Drake\'s',
-        ]
-
-        found_brands = []
-        text_lower = text.lower()
-
-        for brand in known_brands:
-            if brand.lower() in text_lower:
-                found_brands.append(brand)
-
-        return list(set(found_brands))
-
-    def _extract_style_descriptors(self, text: str) -> list[str]:
-        """Extract style-related descriptors from text."""
-        text_lower = text.lower()
-
-        descriptors = []
+    def _extract_brands(self, text_lower: str) -> list[str]:
+        """Extract brand names mentioned in lowercased text."""
+        return _BRAND_MATCHER.find(text_lower)
 
+    def _extract_style_descriptors(self, text_lower: str) -> list[str]:
+        """Extract style-related descriptors from lowercased text."""
         # Aesthetic styles
-        style_patterns = {
-            'minimalist': ['minimal', 'minimalist', 'clean', 'simple'],
-            'workwear': ['workwear', 'work wear', 'utility', 'chore coat'],
-            'streetwear': ['streetwear', 'street style', 'hypebeast'],
-            'heritage': ['heritage', 'classic', 'timeless', 'traditional'],
-            'techwear': ['techwear', 'technical', 'gorpcore'],
-            'japanese': ['japanese', 'japan made', 'made in japan'],
-            'scandinavian': ['scandinavian', 'nordic', 'scandi'],
-            'americana': ['americana', 'ivy style', 'prep'],
-            'military': ['military', 'mil-spec', 'field jacket'],
-            'oversized': ['oversized', 'boxy', 'loose fit'],
-            'slim': ['slim fit', 'skinny', 'tapered'],
-            'raw denim': ['raw denim', 'selvedge', 'unsanforized'],
-        }
-
-        for style, keywords in style_patterns.items():
-            if any(kw in text_lower for kw in keywords):
-                descriptors.append(style)
+        descriptors = _STYLE_MATCHER.find(text_lower)
 
         # Fit descriptors
-        fit_patterns = [
-            r'\b(relaxed|loose|oversized|slim|tapered|straight|wide)\s+fit\b',
-            r'\b(high|mid|low)\s+rise\b',
-        ]
-
-        for pattern in fit_patterns:
-            matches = re.findall(pattern, text_lower)
-            descriptors.extend(matches)
-
-        return list(set(descriptors))
-
-    def _extract_item_types(self, text: str) -> list[str]:
-        """Extract clothing item types mentioned."""
-        text_lower = text.lower()
-
-        items = []
-        item_keywords = [
-            'jeans', 'pants', 'trousers', 'chinos',
-            'jacket', 'coat', 'blazer', 'cardigan',
-            'shirt', 'oxford', 'flannel', 't-shirt',
-            'hoodie', 'sweatshirt', 'sweater',
-            'boots', 'sneakers', 'shoes',
-            'shorts', 'overalls', 'coveralls',
-        ]
-
-        for item in item_keywords:
-            if item in text_lower:
-                items.append(item)
-
-        return list(set(items))
+        descriptors.extend(_FIT_RE.findall(text_lower))
+        descriptors.extend(_RISE_RE.findall(text_lower))
+
+        # Matcher labels are already unique; fit words can repeat or
+        # duplicate a style label, so dedupe in first-seen order
+        return list(dict.fromkeys(descriptors))
+
+    def _extract_item_types(self, text_lower: str) -> list[str]:
+        """Extract clothing item types mentioned in lowercased text."""
+        return _ITEM_MATCHER.find(text_lower)
 
 
 def create_reddit_scraper_without_auth() -> RedditScraper:
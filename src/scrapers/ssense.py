@@ -11,15 +11,51 @@ import json
 import re
 import uuid
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Generator, Optional, List
+from urllib.parse import urljoin
 from bs4 import BeautifulSoup
 import logging
 
-from .base import BaseScraper
+from .base import BaseScraper, json_loads
+from .keywords import KeywordMatcher
 from ..models.clothing import ClothingItem, Brand
 
 logger = logging.getLogger(__name__)
 
+# Patterns used on every page and product card, compiled once at import
+_PRICE_RE = re.compile(r'\$(\d+)')
+_ITEM_LIST_RE = re.compile(r'"@type"\s*:\s*"ItemList"')
+
+# Keywords for each product attribute; the first fit found wins
+_STYLE_VOCABULARY = {
+    'fit': {
+        'slim': ['slim'],
+        'oversized': ['oversized'],
+        'relaxed': ['relaxed'],
+        'tapered': ['tapered'],
+    },
+    'colors': {
+        color: [color]
+        for color in ['black', 'white', 'navy', 'grey', 'blue', 'brown', 'green']
+    },
+    'materials': {
+        mat: [mat]
+        for mat in ['cotton', 'wool', 'silk', 'leather', 'denim', 'nylon', 'polyester']
+    },
+    'style_tags': {
+        'japanese': ['japanese', 'japan'],
+        'minimalist': ['minimal'],
+    },
+}
+
+# All buckets share one matcher so a product's text is scanned once
+_STYLE_MATCHER = KeywordMatcher({
+    (bucket, label): keywords
+    for bucket, labels in _STYLE_VOCABULARY.items()
+    for label, keywords in labels.items()
+})
+
 
 class SSENSEScraper(BaseScraper):
     """
@@ -44,6 +80,7 @@ class SSENSEScraper(BaseScraper):
     }
 
     def __init__(self, **kwargs):
+        kwargs.setdefault('max_retries', 3)
         super().__init__(delay_seconds=3.0, **kwargs)
         self.session.headers.update({
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
@@ -66,29 +103,45 @@ class SSENSEScraper(BaseScraper):
         page = 1
         count = 0
 
-        while page <= max_pages and count < max_products:
-            url = f"{self.BASE_URL}{base_path}?page={page}"
-            logger.info(f"Scraping SSENSE {category} page {page}")
-
-            soup = self.fetch_page(url)
-            if not soup:
-                break
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = executor.submit(self.fetch_page, f"{self.BASE_URL}{base_path}?page={page}")
 
-            products = self._extract_products(soup)
-            if not products:
-                break
+            while pending is not None:
+                logger.info(f"Scraping SSENSE {category} page {page}")
+                soup = pending.result()
+                pending = None
+                if not soup:
+                    break
 
-            for product in products:
-                if count >= max_products:
+                products = self._extract_products(soup)
+                if not products:
                     break
 
-                item = self._convert_to_item(product, category)
-                if item:
-                    yield item
-                    count += 1
+                page += 1
+                next_url = f"{self.BASE_URL}{base_path}?page={page}"
+                more_pages = page <= max_pages
+
+                # If this page can't fill max_products on its own, the next page
+                # will be needed, so fetch it while this one is being converted
+                if more_pages and count + len(products) < max_products:
+                    pending = executor.submit(self._fetch_next_page, next_url)
 
-            page += 1
-            time.sleep(1)
+                for product in products:
+                    if count >= max_products:
+                        break
+
+                    item = self._convert_to_item(product, category)
+                    if item:
+                        yield item
+                        count += 1
+
+                if pending is None and more_pages and count < max_products:
+                    pending = executor.submit(self._fetch_next_page, next_url)
+
+    def _fetch_next_page(self, page_url: str) -> BeautifulSoup | None:
+        """Fetch a follow-up category page, pausing first as between pages."""
+        time.sleep(1)
+        return self.fetch_page(page_url)
 
     def _extract_products(self, soup: BeautifulSoup) -> List[dict]:
         """Extract product data from SSENSE page."""
@@ -96,8 +149,13 @@ class SSENSEScraper(BaseScraper):
 
         # SSENSE often embeds data in script tags
         for script in soup.find_all('script', type='application/ld+json'):
+            # Pages also carry BreadcrumbList, Organization etc. blocks;
+            # only parse the ones that can hold the product list
+            raw = script.string
+            if not raw or not _ITEM_LIST_RE.search(raw):
+                continue
             try:
-                data = json.loads(script.string)
+                data = json_loads(raw)
                 if isinstance(data, dict) and data.get('@type') == 'ItemList':
                     for item in data.get('itemListElement', []):
                         if item.get('@type') == 'ListItem':
@@ -112,6 +170,10 @@ class SSENSEScraper(BaseScraper):
             except (json.JSONDecodeError, TypeError):
                 continue
 
+            # The first ItemList is the page's product grid; later ones repeat it
+            if products:
+                break
+
         # Fallback to HTML parsing
         if not products:
             product_cards = soup.select('[data-testid="product-tile"], .product-tile, .plp-products__product')
@@ -124,14 +186,13 @@ class SSENSEScraper(BaseScraper):
 
                     brand = brand_elem.get_text(strip=True) if brand_elem else "Unknown"
                     name = name_elem.get_text(strip=True) if name_elem else "Unknown"
-                    url = link['href'] if link else ""
-                    if url and not url.startswith('http'):
-                        url = self.BASE_URL + url
+                    href = link['href'] if link else ""
+                    url = urljoin(self.BASE_URL, href) if href else ""
 
                     price = None
                     if price_elem:
                         price_text = price_elem.get_text(strip=True)
-                        price_match = re.search(r'\$(\d+)', price_text)
+                        price_match = _PRICE_RE.search(price_text)
                         if price_match:
                             price = float(price_match.group(1))
 
@@ -161,35 +222,9 @@ class SSENSEScraper(BaseScraper):
         try:
             text = f"{product['name']} {product.get('description', '')}".lower()
 
-            # Fit
-            fit = None
-            if 'slim' in text:
-                fit = 'slim'
-            elif 'oversized' in text:
-                fit = 'oversized'
-            elif 'relaxed' in text:
-                fit = 'relaxed'
-            elif 'tapered' in text:
-                fit = 'tapered'
-
-            # Colors
-            colors = []
-            for color in ['black', 'white', 'navy', 'grey', 'blue', 'brown', 'green']:
-                if color in text:
-                    colors.append(color)
-
-            # Materials
-            materials = []
-            for mat in ['cotton', 'wool', 'silk', 'leather', 'denim', 'nylon', 'polyester']:
-                if mat in text:
-                    materials.append(mat)
-
-            # Style tags
-            style_tags = ['luxury', 'designer']  # SSENSE focuses on designer fashion
-            if 'japanese' in text or 'japan' in text:
-                style_tags.append('japanese')
-            if 'minimal' in text:
-                style_tags.append('minimalist')
+            hits = {bucket: [] for bucket in _STYLE_VOCABULARY}
+            for bucket, label in _STYLE_MATCHER.find(text):
+                hits[bucket].append(label)
 
             return ClothingItem(
                 id=str(uuid.uuid4()),
@@ -197,10 +232,11 @@ class SSENSEScraper(BaseScraper):
                 brand=product['brand'],
                 category=category,
                 description=product.get('description', product['name']),
-                fit=fit,
-                style_tags=style_tags,
-                colors=colors,
-                materials=materials,
+                fit=hits['fit'][0] if hits['fit'] else None,
+                # SSENSE focuses on designer fashion
+                style_tags=['luxury', 'designer', *hits['style_tags']],
+                colors=hits['colors'],
+                materials=hits['materials'],
                 source_url=product.get('url', ''),
                 source_type="ssense",
                 price_usd=product.get('price'),
@@ -11,15 +11,119 @@ IMPORTANT:
 import re
 import uuid
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Generator, Optional, List
+from urllib.parse import urljoin
 from bs4 import BeautifulSoup
+import soupsieve
 import logging
 
-from .base import BaseScraper
+from .base import BaseScraper, class_strainer
+from .keywords import KeywordMatcher
 from ..models.clothing import StyleDiscussion
 
 logger = logging.getLogger(__name__)
 
+# Thread listing selectors, used on every row and compiled once at import
+_THREAD_SELECTOR = soupsieve.compile('.structItem--thread, .discussionListItem')
+_THREAD_TITLE_SELECTOR = soupsieve.compile('.structItem-title a, .title a')
+_THREAD_REPLIES_SELECTOR = soupsieve.compile('.structItem-cell--meta dd, .stats .major')
+
+# Only post bodies are read from a thread page, so the rest of the page
+# (navigation, signatures, sidebars, scripts) is never built into the tree
+_POST_STRAINER = class_strainer({'message-body', 'messageContent', 'bbWrapper'}.__contains__)
+_POST_SELECTOR = soupsieve.compile('.message-body, .messageContent, .bbWrapper')
+
+# Comprehensive list of menswear brands
+_KNOWN_BRANDS = [
+    # Japanese
+    'Orslow', 'Engineered Garments', 'Kapital', 'Visvim', 'Needles',
+    'Beams', 'United Arrows', 'Nanamica', 'Snow Peak', 'And Wander',
+    'Comme des Garcons', 'Yohji Yamamoto', 'Issey Miyake', 'Sacai',
+    'White Mountaineering', 'Porter', 'Master-Piece', 'Momotaro',
+    'Pure Blue Japan', 'Iron Heart', 'The Flat Head', 'Samurai',
+    'Studio D\'Artisan', 'Oni', 'Tanuki', 'Japan Blue', 'Graph Zero',
+
+    # Italian/European Luxury
+    'Brunello Cucinelli', 'Loro Piana', 'Kiton', 'Attolini', 'Isaia',
+    'Boglioli', 'LBM 1911', 'Barena', 'Lardini', 'Caruso', 'Stile Latino',
+    'Borrelli', 'Finamore', 'Marol', 'Mattabisch', 'Sartoria Partenopea',
+
+    # British
+    'Drake\'s', 'Private White VC', 'Sunspel', 'John Smedley', 'Mackintosh',
+    'Barbour', 'Baracuta', 'Grenfell', 'Burberry', 'Aquascutum', 'Fox Brothers',
+    'Holland & Holland', 'Cordings', 'Anderson & Sheppard', 'Henry Poole',
+
+    # American Heritage
+    'Alden', 'Allen Edmonds', 'Florsheim', 'Johnston & Murphy',
+    'Rancourt', 'Quoddy', 'Yuketen', 'Easymoc', 'Oak Street Bootmakers',
+    'Wolverine', 'White\'s Boots', 'Wesco', 'Nick\'s Boots', 'Dayton',
+    'Filson', 'Pendleton', 'Schott', 'Golden Bear', 'Vanson',
+    'Real McCoys', 'Buzz Rickson', 'Toys McCoy',
+
+    # Scandinavian
+    'Acne Studios', 'Our Legacy', 'Norse Projects', 'Wood Wood',
+    'Arket', 'COS', 'Filippa K', 'Tiger of Sweden', 'Samsoe Samsoe',
+    'Hope Stockholm', 'Elvine',
+
+    # French
+    'A.P.C.', 'Ami', 'Lemaire', 'Isabel Marant', 'Officine Generale',
+    'De Bonne Facture', 'Editions M.R.', 'Arpenteur', 'Vetra',
+    'Bleu de Paname', 'Paraboot',
+
+    # Contemporary/Designer
+    'Rick Owens', 'Undercover', 'Number (N)ine', 'Raf Simons',
+    'Dries Van Noten', 'Maison Margiela', 'Lanvin', 'Givenchy',
+    'Balenciaga', 'Vetements', 'Off-White', 'Fear of God',
+
+    # Premium Denim
+    '3sixteen', 'Rogue Territory', 'Taylor Stitch', 'Freenote Cloth',
+    'Left Field NYC', 'Naked & Famous', 'N&F', 'Nudie Jeans',
+    'A.G.', 'Citizens of Humanity', 'Paige',
+
+    # Workwear/Streetwear
+    'Carhartt', 'Carhartt WIP', 'Dickies', 'Stan Ray', 'Universal Works',
+    'Albam', 'Folk', 'YMC', 'Nigel Cabourn', 'Monitaly', 'Arpenteur',
+
+    # Technical
+    'Arc\'teryx', 'Veilance', 'Outlier', 'Mission Workshop', 'Acronym',
+    'Stone Island', 'C.P. Company',
+]
+
+# Style and fit descriptors, each detected by any of its keywords
+_STYLE_PATTERNS = {
+    'sprezzatura': ['sprezzatura', 'nonchalant', 'effortless'],
+    'ivy': ['ivy', 'ivy style', 'prep', 'preppy', 'trad'],
+    'sartorial': ['sartorial', 'tailoring', 'bespoke', 'MTM', 'made to measure'],
+    'workwear': ['workwear', 'heritage', 'utilitarian'],
+    'minimalist': ['minimalist', 'minimal', 'clean lines'],
+    'slim fit': ['slim', 'slim cut', 'narrow'],
+    'relaxed': ['relaxed', 'easy fit', 'loose'],
+    'high rise': ['high rise', 'high waist'],
+    'neapolitan': ['neapolitan', 'napoli', 'italian tailoring'],
+    'british': ['british', 'savile row', 'english cut'],
+    'streetwear': ['streetwear', 'street', 'urban'],
+    'raw denim': ['raw denim', 'selvedge', 'selvage', 'unsanforized'],
+    'goodyear welt': ['goodyear', 'blake', 'welted'],
+}
+
+# Clothing item types
+_ITEM_KEYWORDS = [
+    'suit', 'sport coat', 'blazer', 'odd jacket',
+    'trousers', 'pants', 'chinos', 'jeans', 'denim',
+    'shirt', 'dress shirt', 'ocbd', 'oxford',
+    'tie', 'pocket square', 'grenadine',
+    'shoes', 'boots', 'loafers', 'oxfords', 'derbies',
+    'overcoat', 'topcoat', 'parka', 'jacket',
+    'sweater', 'cardigan', 'knitwear',
+]
+
+# Each vocabulary is matched against a thread in a single scan
+_BRAND_MATCHER = KeywordMatcher({brand: [brand.lower()] for brand in _KNOWN_BRANDS})
+_STYLE_MATCHER = KeywordMatcher(_STYLE_PATTERNS)
+_ITEM_MATCHER = KeywordMatcher(_ITEM_KEYWORDS)
+
 
 class StyleForumScraper(BaseScraper):
     """
@@ -47,7 +151,11 @@ class StyleForumScraper(BaseScraper):
         'WAYWT',
     ]
 
+    # Threads fetched concurrently by search_threads
+    THREAD_WORKERS = 4
+
     def __init__(self, **kwargs):
+        kwargs.setdefault('max_retries', 3)
         super().__init__(delay_seconds=3.0, **kwargs)
         self.session.headers.update({
             'Accept': 'text/html,application/xhtml+xml',
@@ -58,6 +166,7 @@ class StyleForumScraper(BaseScraper):
         self,
         forum_name: str,
         max_pages: int = 10,
+        max_threads: Optional[int] = None,
     ) -> Generator[dict, None, None]:
         """
         Scrape thread listings from a forum.
@@ -65,60 +174,87 @@ class StyleForumScraper(BaseScraper):
         Args:
             forum_name: Key from FORUMS dict
             max_pages: Max pages to scrape
+            max_threads: Max threads to return, or None for no limit
 
         Yields:
             Thread info dicts
         """
-        base_path = self.FORUMS.get(forum_name, forum_name)
-
-        for page in range(1, max_pages + 1):
-            url = f"{self.BASE_URL}{base_path}"
-            if page > 1:
-                url = f"{url}page-{page}"
-
-            logger.info(f"Scraping StyleForum {forum_name} page {page}")
-            soup = self.fetch_page(url)
-            if not soup:
-                break
-
-            # Find thread listings
-            threads = soup.select('.structItem--thread, .discussionListItem')
-            if not threads:
-                break
-
-            for thread in threads:
-                try:
-                    # Extract thread info
-                    title_elem = thread.select_one('.structItem-title a, .title a')
-                    if not title_elem:
+        page = 1
+        count = 0
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = executor.submit(self.fetch_page, self.get_forum_url(forum_name, page))
+
+            while pending is not None:
+                logger.info(f"Scraping StyleForum {forum_name} page {page}")
+                soup = pending.result()
+                pending = None
+                if not soup:
+                    break
+
+                # Find thread listings
+                threads = _THREAD_SELECTOR.select(soup)
+                if not threads:
+                    break
+
+                page += 1
+                next_url = self.get_forum_url(forum_name, page)
+                more_pages = page <= max_pages
+
+                # If this page can't fill max_threads on its own, the next page
+                # will be needed, so fetch it while this one is being consumed
+                if more_pages and (max_threads is None or count + len(threads) < max_threads):
+                    pending = executor.submit(self._fetch_next_page, next_url)
+
+                for thread in threads:
+                    if max_threads is not None and count >= max_threads:
+                        break
+
+                    try:
+                        # Extract thread info
+                        title_elem = _THREAD_TITLE_SELECTOR.select_one(thread)
+                        if not title_elem:
+                            continue
+
+                        title = title_elem.get_text(strip=True)
+                        thread_url = urljoin(self.BASE_URL, title_elem.get('href', ''))
+
+                        # Reply count
+                        replies_elem = _THREAD_REPLIES_SELECTOR.select_one(thread)
+                        replies = 0
+                        if replies_elem:
+                            try:
+                                replies = int(replies_elem.get_text(strip=True).replace(',', ''))
+                            except ValueError:
+                                pass
+
+                        yield {
+                            'title': title,
+                            'url': thread_url,
+                            'replies': replies,
+                            'forum': forum_name,
+                        }
+                        count += 1
+
+                    except Exception as e:
+                        logger.debug(f"Error parsing thread: {e}")
                         continue
 
-                    title = title_elem.get_text(strip=True)
-                    thread_url = title_elem.get('href', '')
-                    if not thread_url.startswith('http'):
-                        thread_url = self.BASE_URL + thread_url
-
-                    # Reply count
-                    replies_elem = thread.select_one('.structItem-cell--meta dd, .stats .major')
-                    replies = 0
-                    if replies_elem:
-                        try:
-                            replies = int(replies_elem.get_text(strip=True).replace(',', ''))
-                        except ValueError:
-                            pass
-
-                    yield {
-                        'title': title,
-                        'url': thread_url,
-                        'replies': replies,
-                        'forum': forum_name,
-                    }
-
-                except Exception as e:
-                    logger.debug(f"Error parsing thread: {e}")
-                    continue
+                # Rows that failed to parse can leave this page short
+                if pending is None and more_pages and (max_threads is None or count < max_threads):
+                    pending = executor.submit(self._fetch_next_page, next_url)
 
-            time.sleep(1)
+    def get_forum_url(self, forum_name: str, page: int = 1) -> str:
+        """Build URL for a forum's thread listing with pagination."""
+        url = f"{self.BASE_URL}{self.FORUMS.get(forum_name, forum_name)}"
+        if page > 1:
+            return f"{url}page-{page}"
+        return url
+
+    def _fetch_next_page(self, page_url: str) -> BeautifulSoup | None:
+        """Fetch a follow-up listing page, pausing first as between pages."""
+        time.sleep(1)
+        return self.fetch_page(page_url)
 
     def scrape_thread(self, thread_info: dict, max_posts: int = 50) -> Optional[StyleDiscussion]:
         """
@@ -131,29 +267,33 @@ class StyleForumScraper(BaseScraper):
         Returns:
             StyleDiscussion or None
         """
-        soup = self.fetch_page(thread_info['url'])
+        soup = self.fetch_page(thread_info['url'], parse_only=_POST_STRAINER)
         if not soup:
             return None
 
         try:
             # Get all post content
-            posts = soup.select('.message-body, .messageContent, .bbWrapper')
+            posts = _POST_SELECTOR.select(soup)
             if not posts:
                 return None
 
-            # Combine post text (first post + top replies)
+            # Combine post text (first post + top replies), stopping at the
+            # first 10 substantial posts rather than extracting text from all
             all_text = []
-            for i, post in enumerate(posts[:max_posts]):
+            for post in posts[:max_posts]:
                 text = post.get_text(strip=True)
                 if len(text) > 50:  # Skip very short posts
                     all_text.append(text)
+                    if len(all_text) == 10:
+                        break
 
-            combined_content = "\n\n".join(all_text[:10])  # First 10 substantial posts
+            combined_content = "\n\n".join(all_text)
 
-            # Extract brands, styles, items
-            brands = self._extract_brands(combined_content)
-            style_descriptors = self._extract_style_descriptors(combined_content)
-            items = self._extract_items(combined_content)
+            # Extract brands, styles, items from text lowered once
+            text_lower = combined_content.lower()
+            brands = self._extract_brands(text_lower)
+            style_descriptors = self._extract_style_descriptors(text_lower)
+            items = self._extract_items(text_lower)
 
             # Only create discussion if it has relevant content
             if not brands and not style_descriptors:
@@ -177,119 +317,17 @@ class StyleForumScraper(BaseScraper):
             logger.error(f"Error scraping thread {thread_info['url']}: {e}")
             return None
 
-    def _extract_brands(self, text: str) -> List[str]:
-        """Extract brand mentions from text."""
-        # Comprehensive list of menswear brands
-        brands = [
-            # Japanese
-            'Orslow', 'Engineered Garments', 'Kapital', 'Visvim', 'Needles',
-            'Beams', 'United Arrows', 'Nanamica', 'Snow Peak', 'And Wander',
-            'Comme des Garcons', 'Yohji Yamamoto', 'Issey Miyake', 'Sacai',
-            'White Mountaineering', 'Porter', 'Master-Piece', 'Momotaro',
-            'Pure Blue Japan', 'Iron Heart', 'The Flat Head', 'Samurai',
-            'Studio D\'Artisan', 'Oni', 'Tanuki', 'Japan Blue', 'Graph Zero',
-
-            # Italian/European Luxury
-            'Brunello Cucinelli', 'Loro Piana', 'Kiton', 'Attolini', 'Isaia',
-            'Boglioli', 'LBM 1911', 'Barena', 'Lardini', 'Caruso', 'Stile Latino',
-            'Borrelli', 'Finamore', 'Marol', 'Mattabisch', 'Sartoria Partenopea',
-
-            # British
-            'Drake\'s', 'Private White VC', 'Sunspel', 'John Smedley', 'Mackintosh',
-            'Barbour', 'Baracuta', 'Grenfell', 'Burberry', 'Aquascutum', 'Fox Brothers',
-            'Holland & Holland', 'Cordings', 'Anderson & Sheppard', 'Henry Poole',
-
-            # American Heritage
-            'Alden', 'Allen Edmonds', 'Florsheim', 'Johnston & Murphy',
-            'Rancourt', 'Quoddy', 'Yuketen', 'Easymoc', 'Oak Street Bootmakers',
-            'Wolverine', 'White\'s Boots', 'Wesco', 'Nick\'s Boots', 'Dayton',
-            'Filson', 'Pendleton', 'Schott', 'Golden Bear', 'Vanson',
-            'Real McCoys', 'Buzz Rickson', 'Toys McCoy',
-
-            # Scandinavian
-            'Acne Studios', 'Our Legacy', 'Norse Projects', 'Wood Wood',
-            'Arket', 'COS', 'Filippa K', 'Tiger of Sweden', 'Samsoe Samsoe',
-            'Hope Stockholm', 'Elvine',
-
-            # French
-            'A.P.C.', 'Ami', 'Lemaire', 'Isabel Marant', 'Officine Generale',
-            'De Bonne Facture', 'Editions M.R.', 'Arpenteur', 'Vetra',
-            'Bleu de Paname', 'Paraboot',
-
-            # Contemporary/Designer
-            'Rick Owens', 'Undercover', 'Number (N)ine', 'Raf Simons',
-            'Dries Van Noten', 'Maison Margiela', 'Lanvin', 'Givenchy',
-            'Balenciaga', 'Vetements', 'Off-White', 'Fear of God',
-
-            # Premium Denim
-            '3sixteen', 'Rogue Territory', 'Taylor Stitch', 'Freenote Cloth',
-            'Left Field NYC', 'Naked & Famous', 'N&F', 'Nudie Jeans',
-            'A.G.', 'Citizens of Humanity', 'Paige',
-
-            # Workwear/Streetwear
-            'Carhartt', 'Carhartt WIP', 'Dickies', 'Stan Ray', 'Universal Works',
-            'Albam', 'Folk', 'YMC', 'Nigel Cabourn', 'Monitaly', 'Arpenteur',
-
-            # Technical
-            'Arc\'teryx', 'Veilance', 'Outlier', 'Mission Workshop', 'Acronym',
-            'Stone Island', 'C.P. Company',
-        ]
-
-        found = []
-        text_lower = text.lower()
-        for brand in brands:
-            if brand.lower() in text_lower:
-                found.append(brand)
-
-        return list(set(found))
-
-    def _extract_style_descriptors(self, text: str) -> List[str]:
-        """Extract style and fit descriptors."""
-        text_lower = text.lower()
-        descriptors = []
-
-        patterns = {
-            'sprezzatura': ['sprezzatura', 'nonchalant', 'effortless'],
-            'ivy': ['ivy', 'ivy style', 'prep', 'preppy', 'trad'],
-            'sartorial': ['sartorial', 'tailoring', 'bespoke', 'MTM', 'made to measure'],
-            'workwear': ['workwear', 'heritage', 'utilitarian'],
-            'minimalist': ['minimalist', 'minimal', 'clean lines'],
-            'slim fit': ['slim', 'slim cut', 'narrow'],
-            'relaxed': ['relaxed', 'easy fit', 'loose'],
-            'high rise': ['high rise', 'high waist'],
-            'neapolitan': ['neapolitan', 'napoli', 'italian tailoring'],
-            'british': ['british', 'savile row', 'english cut'],
-            'streetwear': ['streetwear', 'street', 'urban'],
-            'raw denim': ['raw denim', 'selvedge', 'selvage', 'unsanforized'],
-            'goodyear welt': ['goodyear', 'blake', 'welted'],
-        }
-
-        for style, keywords in patterns.items():
-            if any(kw in text_lower for kw in keywords):
-                descriptors.append(style)
-
-        return list(set(descriptors))
-
-    def _extract_items(self, text: str) -> List[str]:
-        """Extract clothing item types."""
-        text_lower = text.lower()
-        items = []
-
-        item_keywords = [
-            'suit', 'sport coat', 'blazer', 'odd jacket',
-            'trousers', 'pants', 'chinos', 'jeans', 'denim',
-            'shirt', 'dress shirt', 'ocbd', 'oxford',
-            'tie', 'pocket square', 'grenadine',
-            'shoes', 'boots', 'loafers', 'oxfords', 'derbies',
-            'overcoat', 'topcoat', 'parka', 'jacket',
-            'sweater', 'cardigan', 'knitwear',
-        ]
-
-        for item in item_keywords:
-            if item in text_lower:
-                items.append(item)
-
-        return list(set(items))
+    def _extract_brands(self, text_lower: str) -> List[str]:
+        """Extract brand mentions from lowercased text."""
+        return _BRAND_MATCHER.find(text_lower)
+
+    def _extract_style_descriptors(self, text_lower: str) -> List[str]:
+        """Extract style and fit descriptors from lowercased text."""
+        return _STYLE_MATCHER.find(text_lower)
+
+    def _extract_items(self, text_lower: str) -> List[str]:
+        """Extract clothing item types from lowercased text."""
+        return _ITEM_MATCHER.find(text_lower)
 
     def search_threads(
         self,
@@ -311,34 +349,57 @@ class StyleForumScraper(BaseScraper):
             return
 
         # Find search results
-        results = soup.select('.contentRow--thread, .searchResult')
-        count = 0
-
-        for result in results:
-            if count >= max_results:
-                break
-
+        thread_infos = []
+        for result in soup.select('.contentRow--thread, .searchResult'):
             try:
                 link = result.find('a', href=True)
                 if not link:
                     continue
 
-                thread_info = {
+                thread_infos.append({
                     'title': link.get_text(strip=True),
-                    'url': self.BASE_URL + link['href'] if not link['href'].startswith('http') else link['href'],
+                    'url': urljoin(self.BASE_URL, link['href']),
                     'replies': 0,
                     'forum': 'search',
-                }
-
-                discussion = self.scrape_thread(thread_info)
-                if discussion:
-                    yield discussion
-                    count += 1
+                })
 
             except Exception as e:
                 logger.debug(f"Error parsing search result: {e}")
                 continue
 
+        # Threads are fetched a few at a time so their network waits overlap;
+        # discussions are yielded in result order
+        count = 0
+        pending = deque()
+        thread_infos = iter(thread_infos)
+
+        with ThreadPoolExecutor(max_workers=self.THREAD_WORKERS) as executor:
+            try:
+                while count < max_results:
+                    # Keep the window of in-flight thread fetches full
+                    while len(pending) < self.THREAD_WORKERS * 2:
+                        thread_info = next(thread_infos, None)
+                        if thread_info is None:
+                            break
+                        pending.append(executor.submit(self.scrape_thread, thread_info))
+
+                    if not pending:
+                        break
+
+                    try:
+                        discussion = pending.popleft().result()
+                    except Exception as e:
+                        logger.debug(f"Error scraping search result: {e}")
+                        continue
+
+                    if discussion:
+                        yield discussion
+                        count += 1
+            finally:
+                # Don't start fetches nobody will read
+                for future in pending:
+                    future.cancel()
+
     def scrape_products(self, url: str):
         """Not applicable for StyleForum - it's a discussion site."""
         raise NotImplementedError("StyleForum is a discussion site, not e-commerce")
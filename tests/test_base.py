@@ -0,0 +1,76 @@
+"""
+Tests for the shared scraper helpers.
+"""
+import pytest
+from bs4 import BeautifulSoup
+
+from src.scrapers import base
+from src.scrapers.base import class_strainer, json_loads
+from src.scrapers.ecommerce import GenericEcommerceScraper
+from src.scrapers.ssense import SSENSEScraper
+
+PRODUCT_PAGE = """
+<html><head>
+<script type="application/ld+json">{"@type": "BreadcrumbList"}</script>
+<script type="application/ld+json">{"@type": "Product", "name": "Chore Coat", "brand": {"name": "Aimé Leon Dore"}}</script>
+</head><body></body></html>
+"""
+
+LISTING_PAGE = """
+<html><head>
+<script type="application/ld+json">
+{"@type": "ItemList", "itemListElement": [
+  {"@type": "ListItem", "item": {"name": "Jeans", "brand": {"name": "Comme des Garçons"},
+   "url": "https://www.ssense.com/p/1", "offers": {"price": 250}}}
+]}
+</script>
+</head><body></body></html>
+"""
+
+
+@pytest.fixture(params=[False, True], ids=['json', 'orjson'])
+def json_backend(request, monkeypatch):
+    """Run a test with both the stdlib and the orjson parser."""
+    if request.param:
+        pytest.importorskip('orjson')
+    monkeypatch.setattr(base, 'ORJSON_AVAILABLE', request.param)
+    return request.param
+
+
+def test_json_loads_accepts_navigable_string(json_backend):
+    soup = BeautifulSoup(PRODUCT_PAGE, 'lxml')
+    script = soup.find_all('script', type='application/ld+json')[1]
+
+    assert json_loads(script.string)['name'] == 'Chore Coat'
+
+
+def test_extract_product_from_schema(json_backend):
+    soup = BeautifulSoup(PRODUCT_PAGE, 'lxml')
+
+    product = GenericEcommerceScraper().extract_product_from_schema(soup)
+
+    assert product is not None
+    assert product['brand']['name'] == 'Aimé Leon Dore'
+
+
+def test_ssense_item_list(json_backend):
+    soup = BeautifulSoup(LISTING_PAGE, 'lxml')
+
+    products = SSENSEScraper()._extract_products(soup)
+
+    assert [(p['name'], p['brand'], p['price']) for p in products] == [
+        ('Jeans', 'Comme des Garçons', 250),
+    ]
+
+
+def test_class_strainer_keeps_multi_class_elements():
+    html = (
+        '<div class="s-item s-item__pl-on-bottom">kept</div>'
+        '<div class="s-item">kept too</div>'
+        '<div class="s-item__title">dropped</div>'
+        '<div>dropped</div>'
+    )
+
+    soup = BeautifulSoup(html, 'lxml', parse_only=class_strainer({'s-item'}.__contains__))
+
+    assert [div.get_text() for div in soup.find_all('div')] == ['kept', 'kept too']
@@ -0,0 +1,59 @@
+"""
+Tests for eBay brand search.
+"""
+import pytest
+
+from src.scrapers.ebay import EbayScraper
+
+RESULTS_PAGE = b"""
+<html><body>
+<div class="srp-controls">filters</div>
+<ul class="srp-results srp-list clearfix">
+  <li class="s-item s-item__pl-on-bottom">
+    <div class="s-item__title"><span>Kapital Century Denim Jeans</span></div>
+    <a class="s-item__link" href="https://www.ebay.com/itm/1">link</a>
+    <span class="s-item__price">$250.00</span>
+  </li>
+  <li class="s-item s-item__pl-on-bottom">
+    <div class="s-item__title"><span>Kapital Ring Coat</span></div>
+    <a class="s-item__link" href="https://www.ebay.com/itm/2">link</a>
+    <span class="s-item__price">$480.00</span>
+  </li>
+</ul>
+</body></html>
+"""
+
+
+@pytest.fixture(autouse=True)
+def no_page_delay(monkeypatch):
+    monkeypatch.setattr('src.scrapers.ebay.time.sleep', lambda seconds: None)
+
+
+def _scraper(pages, fetched):
+    """Scraper serving the given result pages, then empty ones."""
+    scraper = EbayScraper()
+
+    def fetch_html(url):
+        fetched.append(url)
+        return pages[len(fetched) - 1] if len(fetched) <= len(pages) else b'<html></html>'
+
+    scraper.fetch_html = fetch_html
+    return scraper
+
+
+def test_search_brand_parses_multi_class_listings():
+    items = list(_scraper([RESULTS_PAGE], []).search_brand('Kapital', max_results=10))
+
+    assert [(item.name, item.source_url, item.price_usd) for item in items] == [
+        ('Kapital Century Denim Jeans', 'https://www.ebay.com/itm/1', 250.0),
+        ('Kapital Ring Coat', 'https://www.ebay.com/itm/2', 480.0),
+    ]
+
+
+@pytest.mark.parametrize('brand, max_results, pages', [('Kapital', 3, 2), ('Visvim', 10, 1)])
+def test_search_brand_only_fetches_needed_pages(brand, max_results, pages):
+    fetched = []
+
+    list(_scraper([RESULTS_PAGE, RESULTS_PAGE], fetched).search_brand(brand, max_results=max_results))
+
+    assert len(fetched) == pages
@@ -0,0 +1,110 @@
+"""
+Tests for End Clothing crawl progress.
+"""
+import json
+
+import pytest
+
+from src.models.clothing import ClothingItem
+from src.scrapers.end_clothing import EndClothingScraper
+
+# Two listing pages of two products; later pages are empty
+LISTINGS = {
+    page: ''.join(
+        f'<div data-test-id="ProductCard"><a href="/us/p{page}{name}.html">'
+        f'<span data-test-id="ProductCard__name">p{page}{name}</span></a></div>'
+        for name in 'ab'
+    ).encode()
+    for page in (1, 2)
+}
+
+
+@pytest.fixture(autouse=True)
+def no_page_delay(monkeypatch):
+    monkeypatch.setattr('src.scrapers.end_clothing.time.sleep', lambda seconds: None)
+
+
+def _scraper(checkpoint, fail=()):
+    scraper = EndClothingScraper(checkpoint_path=str(checkpoint), resume=True)
+
+    def fetch_html(url):
+        page = int(url.split('?p=')[1]) if '?p=' in url else 1
+        return LISTINGS.get(page, b'<html></html>')
+
+    def scrape_product_detail(product_info):
+        if product_info['name'] in fail:
+            return None
+        return ClothingItem(
+            id=product_info['name'], name=product_info['name'], brand='Kapital',
+            category='jeans', description='',
+        )
+
+    scraper.fetch_html = fetch_html
+    scraper.scrape_product_detail = scrape_product_detail
+    return scraper
+
+
+def test_resume_retries_failed_products(tmp_path):
+    checkpoint = tmp_path / 'end.json'
+
+    first = _scraper(checkpoint, fail={'p1b'})
+    assert [item.name for item in first.scrape_category('jeans', max_products=2)] == ['p1a', 'p2a']
+    assert json.loads(checkpoint.read_text())['jeans']['failed'] == {'https://www.endclothing.com/us/p1b.html': 1}
+
+    # The resumed crawl goes back to page 1 for the failed product
+    second = _scraper(checkpoint)
+    assert [item.name for item in second.scrape_category('jeans')] == ['p1b', 'p2b']
+
+
+def test_finished_category_is_cleared(tmp_path):
+    checkpoint = tmp_path / 'end.json'
+
+    assert len(list(_scraper(checkpoint).scrape_category('jeans'))) == 4
+    assert json.loads(checkpoint.read_text()) == {}
+
+    # A later resume crawls the finished category again
+    assert len(list(_scraper(checkpoint).scrape_category('jeans'))) == 4
+
+
+def test_fallback_cards_ignore_bem_children(tmp_path):
+    scraper = _scraper(tmp_path / 'end.json')
+    scraper.fetch_html = lambda url: (
+        b'<div class="product-card"><a class="product-card__link" href="/us/a.html">'
+        b'<h3 class="product-card__name">Coat</h3></a>'
+        b'<span class="product-card__price">$100</span></div>'
+        if '?p=' not in url else b'<html></html>'
+    )
+
+    listings = list(scraper.scrape_category_listing('jeans'))
+
+    assert [(p['url'], p['name'], p['price']) for p in listings] == [
+        ('https://www.endclothing.com/us/a.html', 'Coat', None),
+    ]
+
+
+def test_fallback_cards_with_several_classes(tmp_path):
+    scraper = _scraper(tmp_path / 'end.json')
+    scraper.fetch_html = lambda url: (
+        b'<div class="product-card product-card--sale">'
+        b'<a href="/us/a.html"><h3>Coat</h3></a></div>'
+        b'<div class="ProductCard_root__x1">'
+        b'<a class="ProductCard_link__y2" href="/us/b.html"><h3>Shirt</h3></a></div>'
+        if '?p=' not in url else b'<html></html>'
+    )
+
+    listings = list(scraper.scrape_category_listing('jeans'))
+
+    assert [(p['url'], p['name']) for p in listings] == [
+        ('https://www.endclothing.com/us/a.html', 'Coat'),
+        ('https://www.endclothing.com/us/b.html', 'Shirt'),
+    ]
+
+
+def test_infer_category_from_url(tmp_path):
+    scraper = _scraper(tmp_path / 'end.json')
+
+    assert scraper._infer_category_from_url('https://www.endclothing.com/us/men/clothing/jeans') == 'jeans'
+    assert scraper._infer_category_from_url('https://www.endclothing.com/us/men/clothing/jeans/?p=2') == 'jeans'
+    assert scraper._infer_category_from_url('https://www.endclothing.com/gb/men/clothing/t-shirts') == 't-shirts'
+    assert scraper._infer_category_from_url('https://www.endclothing.com/us/men/footwear/boots') == 'footwear'
+    assert scraper._infer_category_from_url('https://www.endclothing.com/us/men/clothing') == 'other'
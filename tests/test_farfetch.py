@@ -0,0 +1,63 @@
+"""
+Tests for Farfetch category listings.
+"""
+import pytest
+
+from src.scrapers.farfetch import FarfetchScraper
+
+
+@pytest.fixture(autouse=True)
+def no_page_delay(monkeypatch):
+    monkeypatch.setattr('src.scrapers.farfetch.time.sleep', lambda seconds: None)
+
+
+def _scraper(fetched):
+    """Scraper whose category pages each list three products."""
+    scraper = FarfetchScraper()
+
+    def fetch_html(url):
+        fetched.append(url)
+        return url.encode()
+
+    scraper.fetch_html = fetch_html
+    scraper._extract_products_from_page = lambda html: [
+        {'name': f'Product {n}', 'brand': 'Lemaire', 'url': f'{html.decode()}#{n}'}
+        for n in range(3)
+    ]
+    return scraper
+
+
+@pytest.mark.parametrize('max_products, pages', [(3, 1), (4, 2), (None, 3)])
+def test_category_listing_only_fetches_needed_pages(max_products, pages):
+    fetched = []
+
+    listings = list(_scraper(fetched).scrape_category_listing('jeans', max_pages=3, max_products=max_products))
+
+    assert len(listings) == (max_products or 9)
+    assert len(fetched) == pages
+
+
+def test_brand_info_reads_description_with_several_classes():
+    scraper = FarfetchScraper()
+    scraper.fetch_html = lambda url: (
+        b'<div class="designer-description ltr-1">French minimalism.</div>'
+    )
+
+    brand = scraper.scrape_brand_info('Lemaire')
+
+    assert brand.description == 'French minimalism.'
+
+
+def test_category_fills_max_products_when_conversions_fail():
+    fetched = []
+    scraper = _scraper(fetched)
+    convert = scraper._convert_to_clothing_item
+    # The first product on each page fails to convert
+    scraper._convert_to_clothing_item = lambda product_info, category: (
+        None if product_info['url'].endswith('#0') else convert(product_info, category)
+    )
+
+    items = list(scraper.scrape_category('jeans', max_pages=3, max_products=3))
+
+    assert len(items) == 3
+    assert len(fetched) == 2
@@ -0,0 +1,85 @@
+"""
+Tests for orchestrator checkpointing.
+"""
+from src.models.clothing import ClothingItem, Brand
+from src.scrapers.orchestrator import DataPipelineOrchestrator
+
+
+def _item(name: str) -> ClothingItem:
+    return ClothingItem(id=name, name=name, brand='Kapital', category='jeans', description=name)
+
+
+def _brand(name: str) -> Brand:
+    return Brand(id=name, name=name, description=name)
+
+
+def _checkpointed(output_dir) -> DataPipelineOrchestrator:
+    orchestrator = DataPipelineOrchestrator(output_dir=str(output_dir))
+    orchestrator.add_item(_item('Century Denim'))
+    orchestrator.add_brand(_brand('Kapital'))
+    orchestrator.add_brand(_brand('Orslow'))
+    orchestrator._save_checkpoint()
+    return orchestrator
+
+
+def test_checkpoint_round_trip(tmp_path):
+    _checkpointed(tmp_path)
+
+    orchestrator = DataPipelineOrchestrator(output_dir=str(tmp_path))
+
+    assert [item.name for item in orchestrator.items] == ['Century Denim']
+    assert [brand.name for brand in orchestrator.brands] == ['Kapital', 'Orslow']
+    assert not orchestrator.add_item(_item('Century Denim'))
+    assert orchestrator._flushed == {'items': 1, 'brands': 2, 'discussions': 0}
+
+
+def test_truncated_last_line_keeps_saved_records(tmp_path):
+    _checkpointed(tmp_path)
+    brands_log = tmp_path / 'checkpoint_brands.jsonl'
+    data = brands_log.read_bytes()
+    # A crash mid-write, with and without the newline getting out
+    for damaged in (data[:-20], data[:-20] + b'\n'):
+        brands_log.write_bytes(damaged)
+
+        orchestrator = DataPipelineOrchestrator(output_dir=str(tmp_path))
+
+        assert [item.name for item in orchestrator.items] == ['Century Denim']
+        assert [brand.name for brand in orchestrator.brands] == ['Kapital']
+        assert brands_log.read_bytes() == data.splitlines(keepends=True)[0]
+
+
+def test_corrupt_middle_line_is_dropped_once(tmp_path):
+    _checkpointed(tmp_path)
+    brands_log = tmp_path / 'checkpoint_brands.jsonl'
+    _, second = brands_log.read_bytes().splitlines(keepends=True)
+    brands_log.write_bytes(b'{not json\n' + second)
+
+    orchestrator = DataPipelineOrchestrator(output_dir=str(tmp_path))
+    assert [brand.name for brand in orchestrator.brands] == ['Orslow']
+    orchestrator.add_brand(_brand('Visvim'))
+    orchestrator._save_checkpoint()
+
+    # The next resume loads cleanly, without duplicating saved records
+    resumed = DataPipelineOrchestrator(output_dir=str(tmp_path))
+    assert [brand.name for brand in resumed.brands] == ['Orslow', 'Visvim']
+    assert [item.name for item in resumed.items] == ['Century Denim']
+    assert len((tmp_path / 'checkpoint_items.jsonl').read_bytes().splitlines()) == 1
+
+
+def test_unloadable_checkpoint_is_moved_aside(tmp_path):
+    _checkpointed(tmp_path)
+    # Valid JSON, but not a record
+    (tmp_path / 'checkpoint_items.jsonl').write_bytes(b'{"unexpected": 1}\n')
+
+    orchestrator = DataPipelineOrchestrator(output_dir=str(tmp_path))
+
+    # Nothing half-loaded, and later saves start fresh logs
+    assert orchestrator.items == []
+    assert orchestrator.brands == []
+    assert not orchestrator.item_hashes
+    assert not (tmp_path / 'checkpoint_items.jsonl').exists()
+    assert len(list(tmp_path.glob('checkpoint_items.jsonl.corrupt-*'))) == 1
+
+    orchestrator.add_item(_item('Century Denim'))
+    orchestrator._save_checkpoint()
+    assert [item.name for item in DataPipelineOrchestrator(output_dir=str(tmp_path)).items] == ['Century Denim']
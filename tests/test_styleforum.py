@@ -0,0 +1,53 @@
+"""
+Tests for StyleForum thread listings.
+"""
+import pytest
+from bs4 import BeautifulSoup
+
+from src.scrapers.styleforum import StyleForumScraper
+
+
+@pytest.fixture(autouse=True)
+def no_page_delay(monkeypatch):
+    monkeypatch.setattr('src.scrapers.styleforum.time.sleep', lambda seconds: None)
+
+
+def _scraper(fetched):
+    """Scraper whose forum pages each list three threads."""
+    scraper = StyleForumScraper()
+
+    def fetch_page(url, parse_only=None):
+        fetched.append(url)
+        return BeautifulSoup(''.join(
+            f'<div class="structItem--thread"><div class="structItem-title">'
+            f'<a href="/threads/{len(fetched)}-{n}/">Thread {n}</a></div></div>'
+            for n in range(3)
+        ), 'lxml')
+
+    scraper.fetch_page = fetch_page
+    return scraper
+
+
+@pytest.mark.parametrize('max_threads, pages', [(3, 1), (4, 2), (None, 3)])
+def test_forum_threads_only_fetch_needed_pages(max_threads, pages):
+    fetched = []
+
+    threads = list(_scraper(fetched).scrape_forum_threads('tailors', max_pages=3, max_threads=max_threads))
+
+    assert len(threads) == (max_threads or 9)
+    assert len(fetched) == pages
+    assert threads[0]['url'] == 'https://www.styleforum.net/threads/1-0/'
+
+
+def test_thread_reads_posts_with_several_classes():
+    scraper = StyleForumScraper()
+    scraper.fetch_html = lambda url: (
+        b'<article class="message-body js-selectToQuote">'
+        b'Picked up a Kapital boro jacket, the fit is relaxed and the indigo is great.</article>'
+        b'<div class="message-body js-x">Orslow fatigue pants are a slim fit and wear in nicely.</div>'
+    )
+
+    discussion = scraper.scrape_thread({'url': 'https://www.styleforum.net/threads/1/', 'title': 'WAYWT', 'forum': 'general'})
+
+    assert discussion.content.startswith('Picked up a Kapital boro jacket')
+    assert 'Orslow fatigue pants' in discussion.content